@@ -0,0 +1 @@
+"""Command-line entry point for running Advent of Code solutions."""
@@ -0,0 +1,69 @@
+"""Advent of Code command line.
+
+Usage:
+    python -m aoc solve 7 [--input path] [--no-cache] [--metrics[=PATH]] [--trace-memory] [--profile=DIR]
+    python -m aoc run [--days "day0*"] [--inputs "inputs/*.txt"] [-j 8] [-o results.jsonl] [--no-cache]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+
+def _solve(args: argparse.Namespace) -> None:
+    """Print the answers for one day, like running its solve.py.
+    Args: args: Parsed solve arguments."""
+    from aoc.runner import ROOT
+    from utils import run_module
+
+    day = f"day{int(args.day):02d}" if args.day.isdigit() else args.day
+    input_file = args.input or os.path.join(ROOT, day, "input.txt")
+    run_module(importlib.import_module(f"{day}.solve"), input_file)
+
+
+def _run(args: argparse.Namespace) -> None:
+    """Solve many inputs on a process pool.
+    Args: args: Parsed run arguments."""
+    from aoc.cache import ResultCache, cache_disabled
+    from aoc.runner import ROOT, discover, run_jobs
+
+    jobs = list(discover(args.days, args.inputs, args.root or ROOT))
+    cache = None if args.no_cache or cache_disabled([]) else ResultCache()
+    if args.output == "-":
+        run_jobs(jobs, sys.stdout, args.workers, cache)
+    else:
+        with open(args.output, "w") as out:
+            run_jobs(jobs, out, args.workers, cache)
+    if cache:
+        cache.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="aoc", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = commands.add_parser(
+        "solve", help="print one day's answers (solver flags such as --no-cache pass through)"
+    )
+    solve_parser.add_argument("day", help="day number or package name, e.g. 7 or day07")
+    solve_parser.add_argument("--input", help="input file (default: dayXX/input.txt)")
+    solve_parser.set_defaults(func=_solve)
+
+    run_parser = commands.add_parser("run", help="solve many inputs on a process pool")
+    run_parser.add_argument("--days", default="day*", help="glob of day directories")
+    run_parser.add_argument("--inputs", default="input*.txt", help="glob of input files in each day")
+    run_parser.add_argument("--root", default=None, help="directory holding the dayXX input directories (default: the repo)")
+    run_parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes")
+    run_parser.add_argument("-o", "--output", default="-", help="JSON lines output file")
+    run_parser.add_argument("--no-cache", action="store_true", help="ignore and don't fill the result cache")
+    run_parser.set_defaults(func=_run)
+
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != "solve":
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
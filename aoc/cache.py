@@ -0,0 +1,115 @@
+"""Content-addressed result cache backed by SQLite.
+
+Answers are keyed by the input bytes, the solver module source and the part
+function, so editing either the input or the solver invalidates them. The
+store is bounded in size and evicts least recently used answers first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections.abc import Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PATH = os.path.join(ROOT, ".cache", "results.sqlite")
+DEFAULT_MAX_BYTES = 64 << 20
+MISSING = object()
+
+
+def cache_disabled(argv: list[str] | None = None) -> bool:
+    """Check whether caching was turned off.
+    Args:
+        argv: Command-line arguments (default: sys.argv).
+    Returns:
+        True if --no-cache was passed or AOC_NO_CACHE is set."""
+    argv = sys.argv[1:] if argv is None else argv
+    return "--no-cache" in argv or bool(os.environ.get("AOC_NO_CACHE"))
+
+
+def file_digest(path: str) -> str:
+    """Hash a file's contents.
+    Args:
+        path: File path.
+    Returns:
+        Hex SHA-256 digest."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def cache_key(input_digest: str, part_func: Callable, number: int) -> str:
+    """Build the cache key for one part of one input.
+    Args:
+        input_digest: Digest of the input file (see file_digest).
+        part_func: Part function; its module source is hashed.
+        number: Part number, which tells lambdas apart.
+    Returns:
+        Hex key."""
+    module_file = sys.modules[part_func.__module__].__file__
+    name = f"{part_func.__qualname__}#{number}"
+    return hashlib.sha256(
+        f"{input_digest}:{file_digest(module_file)}:{name}".encode()
+    ).hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU store of JSON-encoded answers.
+    Args:
+        path: SQLite database path (default: $AOC_CACHE or .cache/results.sqlite).
+        max_bytes: Maximum total size of stored answers."""
+
+    def __init__(self, path: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        path = path or os.environ.get("AOC_CACHE", DEFAULT_PATH)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.max_bytes = max_bytes
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results"
+            " (key TEXT PRIMARY KEY, value TEXT, size INTEGER, used INTEGER)"
+        )
+
+    def get(self, key: str):
+        """Look up an answer and mark it as recently used.
+        Args:
+            key: Cache key.
+        Returns:
+            The stored answer, or MISSING."""
+        row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return MISSING
+        with self.db:
+            self.db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time_ns(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, answer) -> None:
+        """Store an answer, evicting least recently used ones over the size bound.
+        Args:
+            key: Cache key.
+            answer: JSON-serializable answer."""
+        value = json.dumps(answer, default=str)
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time_ns()),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used answers until the store fits max_bytes."""
+        excess = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        excess -= self.max_bytes
+        if excess <= 0:
+            return
+        stale = []
+        for key, size in self.db.execute("SELECT key, size FROM results ORDER BY used"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.db.executemany("DELETE FROM results WHERE key = ?", stale)
+
+    def close(self) -> None:
+        """Close the database."""
+        self.db.close()
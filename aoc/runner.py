@@ -0,0 +1,133 @@
+"""Run many (day, input, part) jobs across a process pool.
+
+Each input is one job: a worker parses it once and solves all of its uncached
+parts, so parsed data never crosses a process boundary. Parts already in the
+result cache are answered without parsing. Results are written as JSON lines
+as soon as each input finishes.
+"""
+
+import glob
+import importlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TextIO
+
+from aoc.cache import MISSING, ResultCache, cache_key, file_digest
+from utils import load_input
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def discover(
+    days: str = "day*", inputs: str = "input*.txt", root: str = ROOT
+) -> Iterator[tuple[str, str]]:
+    """Find (day, input file) pairs.
+    Args:
+        days: Glob matched against day directories under root.
+        inputs: Glob matched inside each day directory.
+        root: Directory holding dayXX input directories (default: the repo).
+    Yields:
+        Tuples of (day module name, input file path)."""
+    for day_dir in sorted(glob.glob(os.path.join(root, days))):
+        if not os.path.isfile(os.path.join(ROOT, os.path.basename(day_dir), "solve.py")):
+            continue
+        for path in sorted(glob.glob(os.path.join(day_dir, inputs))):
+            yield os.path.basename(day_dir), path
+
+
+def _solver(day: str):
+    """Import a day's solver module.
+    Args: day: Day package name (e.g. "day07").
+    Returns: The dayXX.solve module."""
+    return importlib.import_module(f"{day}.solve")
+
+
+def _input_job(day: str, path: str, parts: list[int]) -> list[dict]:
+    """Parse one input and solve the given parts in the same worker.
+    Args: day: Day package name.
+          path: Input file path.
+          parts: Part numbers (1-based) to solve.
+    Returns: One record per part with its answer and seconds, or its error."""
+    module = _solver(day)
+    parsed = load_input(module, path)
+    records = []
+    for part in parts:
+        start = time.perf_counter()
+        try:
+            answer = module.PARTS[part - 1](parsed)
+        except Exception as e:
+            records.append({"part": part, "error": repr(e)})
+            continue
+        records.append({"part": part, "answer": answer, "seconds": time.perf_counter() - start})
+    return records
+
+
+def _write(out: TextIO, record: dict) -> None:
+    """Write one JSON lines record.
+    Args: out: Output stream.
+          record: Record to write."""
+    out.write(json.dumps(record, default=str) + "\n")
+    out.flush()
+
+
+def _cached_parts(
+    cache: ResultCache | None, day: str, path: str, out: TextIO
+) -> dict[int, str | None]:
+    """Write cached answers for an input and report the parts still to solve.
+    Args: cache: Result cache, or None when caching is disabled.
+          day: Day package name.
+          path: Input file path.
+          out: Output stream.
+    Returns: Cache key (None without a cache) by part number, for uncached parts."""
+    part_funcs = _solver(day).PARTS
+    if cache is None:
+        return dict.fromkeys(range(1, len(part_funcs) + 1))
+    input_digest = file_digest(path)
+    missing = {}
+    for number, part_func in enumerate(part_funcs, 1):
+        key = cache_key(input_digest, part_func, number)
+        answer = cache.get(key)
+        if answer is MISSING:
+            missing[number] = key
+        else:
+            _write(out, {"day": day, "input": path, "part": number, "answer": answer, "cached": True})
+    return missing
+
+
+def run_jobs(
+    jobs: list[tuple[str, str]],
+    out: TextIO,
+    workers: int | None = None,
+    cache: ResultCache | None = None,
+) -> None:
+    """Parse every input once and solve all of its uncached parts on a process pool.
+    Args:
+        jobs: (day, input file) pairs.
+        out: Stream receiving one JSON record per part (or per failed parse).
+        workers: Worker processes (default: CPU count).
+        cache: Result cache consulted before and filled after solving."""
+    with ProcessPoolExecutor(workers) as pool:
+        pending = {}
+        todo = {}
+        for day, path in jobs:
+            todo[day, path] = _cached_parts(cache, day, path, out)
+            if todo[day, path]:
+                future = pool.submit(_input_job, day, path, list(todo[day, path]))
+                pending[future] = day, path
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                day, path = pending.pop(future)
+                record = {"day": day, "input": path}
+                try:
+                    results = future.result()
+                except Exception as e:
+                    _write(out, record | {"error": repr(e)})
+                    continue
+                for result in results:
+                    if cache is not None and "answer" in result:
+                        cache.put(todo[day, path][result["part"]], result["answer"])
+                    _write(out, record | result)
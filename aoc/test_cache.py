@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from day07.solve import count_paths, count_visited
+
+from .cache import MISSING, ResultCache, cache_disabled, cache_key, file_digest
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "results.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        cache = ResultCache(self.path)
+        self.assertIs(cache.get("k"), MISSING)
+        cache.put("k", 2**80)
+        cache.close()
+        self.assertEqual(ResultCache(self.path).get("k"), 2**80)
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(self.path, max_bytes=4)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        cache.put("d", 4)
+        cache.put("e", 5)
+        self.assertIs(cache.get("b"), MISSING)
+        self.assertEqual(cache.get("e"), 5)
+
+    def test_key_depends_on_input_and_part(self):
+        input_file = os.path.join(self.tmp.name, "input.txt")
+        with open(input_file, "w") as f:
+            f.write("S\n")
+        digest = file_digest(input_file)
+        key = cache_key(digest, count_visited, 1)
+        self.assertNotEqual(key, cache_key(digest, count_paths, 2))
+        with open(input_file, "w") as f:
+            f.write("S.\n")
+        self.assertNotEqual(key, cache_key(file_digest(input_file), count_visited, 1))
+
+    def test_cache_disabled(self):
+        self.assertTrue(cache_disabled(["--no-cache"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
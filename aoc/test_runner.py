@@ -0,0 +1,55 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from .cache import ResultCache
+from .runner import discover, run_jobs
+
+INPUTS = {
+    "day01": "L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n",
+    "day07": "..S..\n..^..\n.^.^.\n.....\n",
+}
+
+
+class TestRunner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        for day, text in INPUTS.items():
+            os.mkdir(os.path.join(self.tmp.name, day))
+            with open(os.path.join(self.tmp.name, day, "input.txt"), "w") as f:
+                f.write(text)
+        os.mkdir(os.path.join(self.tmp.name, "day99"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_discover(self):
+        self.assertEqual([day for day, _ in discover(root=self.tmp.name)], ["day01", "day07"])
+
+    def run_all(self, cache=None):
+        out = io.StringIO()
+        run_jobs(list(discover(root=self.tmp.name)), out, workers=2, cache=cache)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_run_jobs(self):
+        answers = {(r["day"], r["part"]): r["answer"] for r in self.run_all()}
+        self.assertEqual(
+            answers, {("day01", 1): 3, ("day01", 2): 6, ("day07", 1): 3, ("day07", 2): 4}
+        )
+
+    def test_second_run_is_cached(self):
+        cache = ResultCache(os.path.join(self.tmp.name, "results.sqlite"))
+        first = self.run_all(cache)
+        second = self.run_all(cache)
+        self.assertFalse(any(r.get("cached") for r in first))
+        self.assertTrue(all(r["cached"] for r in second))
+        self.assertEqual(
+            sorted((r["day"], r["part"], r["answer"]) for r in first),
+            sorted((r["day"], r["part"], r["answer"]) for r in second),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+"""Benchmarks for Advent of Code solutions."""
@@ -0,0 +1,41 @@
+"""Benchmark solvers on synthetic inputs of growing size.
+
+Usage: python -m bench [--days 1 8] [--variants NAME] [--scale 0.5] [--repeat 3]
+                       [--out bench_results.json]
+"""
+
+import argparse
+import json
+import platform
+
+from bench.days import DAYS, VARIANTS
+from bench.harness import run_day
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=sorted(DAYS))
+    parser.add_argument("--variants", nargs="*", default=[], choices=sorted(VARIANTS))
+    parser.add_argument("--scale", type=float, default=1.0, help="factor applied to default sizes")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per size (best kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_results.json")
+    args = parser.parse_args()
+
+    results = []
+    for day in args.days + args.variants:
+        label = f"day{day:02d}" if isinstance(day, int) else day
+        for result in run_day(day, args.scale, args.repeat, args.seed):
+            exponent = result["exponent"]
+            print(
+                f"{label + ' ' + result['case']:<34} "
+                + " ".join(f"{s:9.4f}s" for s in result["seconds"])
+                + (f"  ~n^{exponent:.2f}" if exponent is not None else "")
+            )
+            results.append(result)
+    with open(args.out, "w") as f:
+        json.dump({"python": platform.python_version(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
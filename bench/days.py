@@ -0,0 +1,248 @@
+"""Benchmark registry: generator, sizes and timed cases for every day."""
+
+import io
+from collections.abc import Callable
+from functools import partial
+from typing import NamedTuple
+
+from bench import generators
+
+Setup = Callable[[str], Callable[[], object]]
+
+
+class Day(NamedTuple):
+    """Benchmark definition for one day.
+    Args:
+        generate: Input generator taking (size, rng).
+        sizes: Default input sizes, smallest first.
+        cases: Function returning {case name: setup}, imported lazily."""
+
+    generate: Callable
+    sizes: tuple[int, ...]
+    cases: Callable[[], dict[str, Setup]]
+
+
+def lines_case(func: Callable) -> Setup:
+    """Time a function that takes raw lines.
+    Args: func: Part function taking lines.
+    Returns: Setup building a zero-argument callable from input text."""
+
+    def setup(text: str) -> Callable[[], object]:
+        lines = text.splitlines(keepends=True)
+        return lambda: func(lines)
+
+    return setup
+
+
+def parse_case(parse: Callable) -> Setup:
+    """Time a day's parse function.
+    Args: parse: Function taking an iterable of lines.
+    Returns: Setup building a zero-argument callable from input text."""
+    return lambda text: lambda: parse(io.StringIO(text))
+
+
+def parsed_case(parse: Callable, func: Callable) -> Setup:
+    """Time a function that takes parsed data (parsing is not timed).
+    Args: parse: Function taking an iterable of lines.
+          func: Part function taking parsed data.
+    Returns: Setup building a zero-argument callable from input text."""
+
+    def setup(text: str) -> Callable[[], object]:
+        parsed = parse(io.StringIO(text))
+        return lambda: func(parsed)
+
+    return setup
+
+
+def _parsed_cases(parse: Callable, **parts: Callable) -> dict[str, Setup]:
+    """Build parse and part cases for a day using utils.run.
+    Args: parse: The day's parse function.
+          parts: Part functions by case name.
+    Returns: Cases by name."""
+    return {"parse": parse_case(parse)} | {
+        name: parsed_case(parse, func) for name, func in parts.items()
+    }
+
+
+def _day01():
+    from day01.solve import (
+        DialStream,
+        Part1Simulator,
+        Part2Simulator,
+        VectorizedDialSimulator,
+        parse,
+    )
+
+    return {
+        "part1": lines_case(Part1Simulator.solve),
+        "part2": lines_case(Part2Simulator.solve),
+        "part1_vectorized": lines_case(VectorizedDialSimulator.solve_part1),
+        "part2_vectorized": lines_case(VectorizedDialSimulator.solve_part2),
+        "both_streaming": lines_case(lambda lines: DialStream().feed(parse(lines))),
+    }
+
+
+def _day02():
+    from day02.solve import (
+        is_invalid,
+        is_invalid_v2,
+        sum_invalid_ids,
+        sum_invalid_ids_parallel,
+        sum_repeated_ids,
+    )
+
+    return {
+        "part1_brute_force": lines_case(lambda lines: sum_invalid_ids(lines, is_invalid)),
+        "part2_brute_force": lines_case(lambda lines: sum_invalid_ids(lines, is_invalid_v2)),
+        "part2_brute_force_parallel": lines_case(
+            lambda lines: sum_invalid_ids_parallel(lines, is_invalid_v2, chunk_size=100_000)
+        ),
+        "part1": lines_case(lambda lines: sum_repeated_ids(lines, twice_only=True)),
+        "part2": lines_case(lambda lines: sum_repeated_ids(lines, twice_only=False)),
+    }
+
+
+def _day03():
+    from day03.solve import solve, solve_batch, solve_many
+
+    return {
+        "part1": lines_case(lambda lines: solve(lines, 2)),
+        "part2": lines_case(lambda lines: solve(lines, 12)),
+        "both": lines_case(lambda lines: solve_many(lines, (2, 12))),
+        "part1_batch": lines_case(lambda lines: solve_batch(lines, 2)),
+        "part2_batch": lines_case(lambda lines: solve_batch(lines, 12)),
+    }
+
+
+def _day04():
+    from day04.solve import solve_part1, solve_part1_loop, solve_part2, solve_part2_rescan
+
+    return {
+        "part1": lines_case(solve_part1),
+        "part2": lines_case(solve_part2),
+        "part2_rescan": lines_case(solve_part2_rescan),
+        "part1_loop": lines_case(solve_part1_loop),
+    }
+
+
+def _day05():
+    from day05.solve import solve_part1, solve_part1_batch, solve_part1_bisect, solve_part2
+
+    return {
+        "part1": lines_case(solve_part1),
+        "part2": lines_case(solve_part2),
+        "part1_batch": lines_case(solve_part1_batch),
+        "part1_bisect": lines_case(solve_part1_bisect),
+    }
+
+
+def _day06():
+    from day06.solve import parse, solve_part1, solve_part2, total_horizontal, total_vertical
+
+    return {
+        "part1": lines_case(solve_part1),
+        "part2": lines_case(solve_part2),
+    } | _parsed_cases(parse, part1_scanned=total_horizontal, part2_scanned=total_vertical)
+
+
+def _day06_products():
+    from day06.solve import parse, total_horizontal, total_vertical
+
+    modulus = 10**9 + 7
+    return _parsed_cases(
+        parse,
+        part1=total_horizontal,
+        part2=total_vertical,
+        part1_mod=lambda problems: total_horizontal(problems, modulus),
+        part2_mod=lambda problems: total_vertical(problems, modulus),
+    )
+
+
+def _day07():
+    from day07.solve import (
+        Manifold,
+        count_paths,
+        count_paths_recursive,
+        count_visited,
+        count_visited_recursive,
+        parse,
+        sweep,
+        sweep_vectorized,
+    )
+
+    return _parsed_cases(
+        parse,
+        part1=count_visited,
+        part2=count_paths,
+        part1_recursive=count_visited_recursive,
+        part2_recursive=count_paths_recursive,
+        both_vectorized=sweep_vectorized,
+        manifold_build=lambda parsed: Manifold(parsed[0]),
+    ) | {"both_streaming": lines_case(sweep)}
+
+
+def _day08():
+    from day08.solve import (
+        build_sorted_edges,
+        count_part1,
+        count_part2,
+        count_part2_graph,
+        iter_sorted_edges,
+        parse,
+    )
+
+    return _parsed_cases(
+        parse,
+        build_sorted_edges=build_sorted_edges,
+        iter_sorted_edges=lambda points: list(iter_sorted_edges(points)),
+        part1=lambda points: count_part1(points, len(points) // 2),
+        part2=count_part2,
+        part2_graph=count_part2_graph,
+    )
+
+
+def _day09():
+    from day09.solve import count_part1, count_part2, parse
+
+    return _parsed_cases(parse, part1=count_part1, part2=count_part2)
+
+
+def _day10():
+    from day10.solve import count_part1, count_part2, parse
+
+    return _parsed_cases(parse, part1=count_part1, part2=count_part2)
+
+
+def _day11():
+    from day11.solve import count_part1, count_part2, parse
+
+    return _parsed_cases(parse, part1=count_part1, part2=count_part2)
+
+
+def _day12():
+    from day12.solve import count_part1, parse
+
+    return _parsed_cases(parse, part1=count_part1)
+
+
+DAYS = {
+    1: Day(generators.day01, (10_000, 100_000, 1_000_000), _day01),
+    2: Day(generators.day02, (10_000, 100_000, 1_000_000), _day02),
+    3: Day(generators.day03, (1_000, 10_000, 100_000), _day03),
+    4: Day(generators.day04, (64, 128, 256), _day04),
+    5: Day(generators.day05, (300, 1_000, 3_000), _day05),
+    6: Day(generators.day06, (1_000, 10_000, 100_000), _day06),
+    7: Day(generators.day07, (100, 200, 400), _day07),
+    8: Day(generators.day08, (100, 200, 400), _day08),
+    9: Day(generators.day09, (20, 40, 80), _day09),
+    10: Day(generators.day10, (10, 20, 40), _day10),
+    11: Day(generators.day11, (1_000, 10_000, 100_000), _day11),
+    12: Day(generators.day12, (10, 50, 200), _day12),
+}
+
+# Extra workloads benchmarked on demand (python -m bench --variants NAME)
+VARIANTS = {
+    "day06-products": Day(
+        partial(generators.day06, rows=500, max_digits=30), (100, 200, 400), _day06_products
+    ),
+}
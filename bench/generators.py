@@ -0,0 +1,215 @@
+"""Synthetic puzzle input generators, one per day, parameterized by size."""
+
+import random
+
+SHAPES = """\
+0:
+###
+##.
+##.
+
+1:
+###
+##.
+.##
+
+2:
+.##
+###
+##.
+
+3:
+##.
+###
+##.
+
+4:
+###
+#..
+###
+
+5:
+###
+.#.
+###
+"""
+
+
+def day01(size: int, rng: random.Random) -> str:
+    """Dial rotations.
+    Args: size: Number of rotations.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    return "".join(f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(size))
+
+
+def day02(size: int, rng: random.Random) -> str:
+    """Comma-separated ID ranges.
+    Args: size: Total number of IDs covered by the ranges.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    width = max(size // 10, 1)
+    ranges = []
+    for _ in range(10):
+        start = rng.randint(10**3, 10**9)
+        ranges.append(f"{start}-{start + width - 1}")
+    return ",".join(ranges) + "\n"
+
+
+def day03(size: int, rng: random.Random) -> str:
+    """Battery banks of 100 digits.
+    Args: size: Number of banks.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    return "".join(
+        "".join(rng.choice("123456789") for _ in range(100)) + "\n" for _ in range(size)
+    )
+
+
+def day04(size: int, rng: random.Random) -> str:
+    """Square grid of paper rolls.
+    Args: size: Grid side length.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    return "".join(
+        "".join("@" if rng.random() < 0.6 else "." for _ in range(size)) + "\n"
+        for _ in range(size)
+    )
+
+
+def day05(size: int, rng: random.Random) -> str:
+    """Fresh ID ranges followed by ingredient IDs.
+    Args: size: Number of ranges and of IDs.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    span = 10**12
+    lines = []
+    for _ in range(size):
+        start = rng.randint(1, span)
+        lines.append(f"{start}-{start + rng.randint(0, 10**9)}\n")
+    lines.append("\n")
+    lines.extend(f"{rng.randint(1, span)}\n" for _ in range(size))
+    return "".join(lines)
+
+
+def day06(size: int, rng: random.Random, rows: int = 3, max_digits: int = 4) -> str:
+    """Cephalopod math worksheet.
+    Args: size: Number of problems.
+          rng: Random source.
+          rows: Number of operand rows.
+          max_digits: Maximum digits per operand.
+    Returns: Puzzle input text."""
+    columns: list[list[str]] = [[] for _ in range(rows + 1)]
+    for _ in range(size):
+        width = rng.randint(1, max_digits)
+        for row in range(rows):
+            number = str(rng.randint(1, 9)) + "".join(
+                rng.choice("0123456789") for _ in range(rng.randint(0, width - 1))
+            )
+            columns[row].append(number.ljust(width) if rng.random() < 0.5 else number.rjust(width))
+        columns[rows].append(rng.choice("+*").ljust(width))
+    return "".join(" ".join(cells) + "\n" for cells in columns)
+
+
+def day07(size: int, rng: random.Random) -> str:
+    """Tachyon manifold with splitters on every other row.
+    Args: size: Number of rows and columns.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    lines = ["." * (size // 2) + "S" + "." * (size - size // 2 - 1)]
+    for row in range(1, size):
+        if row % 2:
+            lines.append("." * size)
+        else:
+            lines.append("".join("^" if rng.random() < 0.3 else "." for _ in range(size)))
+    return "".join(line + "\n" for line in lines)
+
+
+def day08(size: int, rng: random.Random) -> str:
+    """Junction box coordinates.
+    Args: size: Number of points.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    return "".join(
+        f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}\n"
+        for _ in range(size)
+    )
+
+
+def day09(size: int, rng: random.Random) -> str:
+    """Rectilinear staircase polygon.
+    Args: size: Approximate number of vertices.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    steps = max(size // 2 - 1, 1)
+    x = y = 0
+    points = [(0, 0)]
+    for _ in range(steps):
+        x += rng.randint(1, 1000)
+        points.append((x, y))
+        y += rng.randint(1, 1000)
+        points.append((x, y))
+    points.append((0, y))
+    return "".join(f"{px},{py}\n" for px, py in points)
+
+
+def day10(size: int, rng: random.Random) -> str:
+    """Machines with light diagrams, buttons and joltage targets.
+    Args: size: Number of machines.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    lines = []
+    for _ in range(size):
+        lights = rng.randint(4, 8)
+        buttons = [
+            sorted(rng.sample(range(lights), rng.randint(1, lights)))
+            for _ in range(rng.randint(4, 8))
+        ]
+        for light in set(range(lights)) - {i for b in buttons for i in b}:
+            rng.choice(buttons).append(light)
+        buttons = [sorted(b) for b in buttons]
+        diagram = set()
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            diagram ^= set(button)
+        joltage = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 5)
+            for light in button:
+                joltage[light] += presses
+        lines.append(
+            "[" + "".join("#" if i in diagram else "." for i in range(lights)) + "] "
+            + " ".join("(" + ",".join(map(str, b)) + ")" for b in buttons)
+            + " {" + ",".join(map(str, joltage)) + "}\n"
+        )
+    return "".join(lines)
+
+
+def day11(size: int, rng: random.Random, layers: int = 20) -> str:
+    """Layered device graph containing you, svr, dac, fft and out.
+    Args: size: Approximate number of nodes.
+          rng: Random source.
+          layers: Number of layers.
+    Returns: Puzzle input text."""
+    width = max(size // layers, 2)
+    grid = [[f"n{layer}x{i}" for i in range(width)] for layer in range(layers)]
+    grid[0][0], grid[0][1] = "you", "svr"
+    grid[layers // 3][0], grid[2 * layers // 3][0] = "dac", "fft"
+    lines = []
+    for layer in range(layers):
+        for node in grid[layer]:
+            targets = ["out"] if layer == layers - 1 else rng.sample(grid[layer + 1], 2)
+            lines.append(f"{node}: {' '.join(targets)}\n")
+    return "".join(lines)
+
+
+def day12(size: int, rng: random.Random) -> str:
+    """Present shapes followed by tree regions.
+    Args: size: Number of regions.
+          rng: Random source.
+    Returns: Puzzle input text."""
+    lines = [SHAPES, "\n"]
+    for _ in range(size):
+        w, h = rng.randint(10, 14), rng.randint(10, 14)
+        qty = [rng.randint(0, w * h // 42) for _ in range(6)]
+        lines.append(f"{w}x{h}: {' '.join(map(str, qty))}\n")
+    return "".join(lines)
@@ -0,0 +1,75 @@
+"""Time benchmark cases across input sizes and estimate their complexity."""
+
+import math
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from bench.days import DAYS, VARIANTS
+
+
+def measure(func: Callable[[], object], repeat: int = 1) -> tuple[float, int]:
+    """Time a callable and record its peak traced memory.
+    One untimed call runs first, so lazy imports and other one-off setup inside the
+    callable do not land in the timing of the first size.
+    Args: func: Zero-argument callable.
+          repeat: Number of timed runs (best is kept).
+    Returns: Tuple of (best seconds, peak bytes)."""
+    func()
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def complexity_exponent(sizes: list[int], seconds: list[float]) -> float | None:
+    """Least-squares slope of log(time) against log(size).
+    Args: sizes: Input sizes.
+          seconds: Wall times for each size.
+    Returns: Estimated exponent k in time ~ size**k, or None if undetermined."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var = sum((x - mean_x) ** 2 for x, _ in points)
+    if not var:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var
+
+
+def run_day(day: int | str, scale: float = 1.0, repeat: int = 1, seed: int = 0) -> list[dict]:
+    """Benchmark every case of one day at each of its sizes.
+    Args: day: Day number, or a VARIANTS name.
+          scale: Factor applied to the default sizes.
+          repeat: Timed runs per measurement.
+          seed: Seed for the input generator.
+    Returns: One result dict per case."""
+    spec = DAYS[day] if day in DAYS else VARIANTS[day]
+    sizes = [max(1, round(size * scale)) for size in spec.sizes]
+    inputs = [spec.generate(size, random.Random(seed)) for size in sizes]
+    results = []
+    for name, setup in spec.cases().items():
+        seconds, peaks = [], []
+        for text in inputs:
+            elapsed, peak = measure(setup(text), repeat)
+            seconds.append(elapsed)
+            peaks.append(peak)
+        results.append(
+            {
+                "day": day,
+                "case": name,
+                "sizes": sizes,
+                "seconds": seconds,
+                "peak_bytes": peaks,
+                "exponent": complexity_exponent(sizes, seconds),
+            }
+        )
+    return results
@@ -0,0 +1,114 @@
+"""Compare the readlines() input path against the memory-mapped line iterator.
+
+Usage: python -m bench.io_throughput [--mb 64 128 256]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from utils import MappedLines, iter_lines
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _readlines(path: str) -> int:
+    """Consume a file through readlines().
+    Args: path: Input file path.
+    Returns: Number of non-empty lines."""
+    with open(path) as f:
+        return sum(1 for _ in iter_lines(f.readlines()))
+
+
+def _mapped(path: str) -> int:
+    """Consume a file through MappedLines.
+    Args: path: Input file path.
+    Returns: Number of non-empty lines."""
+    return sum(1 for _ in iter_lines(MappedLines(path)))
+
+
+READERS = {"readlines": _readlines, "mmap": _mapped}
+
+
+def _write_input(path: str, megabytes: int) -> None:
+    """Write a synthetic day01-style input of the given size.
+    Args: path: Output file path.
+          megabytes: Approximate file size in MiB."""
+    block = "".join(f"{'LR'[i % 2]}{i % 997 + 1}\n" for i in range(10_000))
+    with open(path, "w") as f:
+        for _ in range(megabytes * (1 << 20) // len(block)):
+            f.write(block)
+
+
+# ru_maxrss survives fork and exec on Linux, so it would report the parent's peak;
+# VmHWM in /proc is reset for the new address space
+_RSS_PROBE = """\
+import resource, sys
+from bench.io_throughput import READERS
+READERS[sys.argv[1]](sys.argv[2])
+try:
+    with open("/proc/self/status") as f:
+        hwm = next(line for line in f if line.startswith("VmHWM:"))
+    print(int(hwm.split()[1]) * 1024)
+except OSError:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(rss * (1 if sys.platform == "darwin" else 1024))
+"""
+
+
+def peak_rss(name: str, path: str) -> int:
+    """Run one reader in a fresh interpreter and report its peak resident set size.
+    Unlike tracemalloc, this counts resident pages of the memory-mapped file.
+    Args: name: READERS key.
+          path: Input file path.
+    Returns: Peak RSS in bytes."""
+    result = subprocess.run(
+        [sys.executable, "-c", _RSS_PROBE, name, path],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+def measure(reader, path: str) -> dict:
+    """Time one reader and record its peak Python heap usage.
+    Args: reader: Function that consumes the file.
+          path: Input file path.
+    Returns: Dict with seconds, MiB/s and peak traced bytes (Python heap only)."""
+    start = time.perf_counter()
+    reader(path)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    reader(path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    mib = os.path.getsize(path) / (1 << 20)
+    return {"seconds": seconds, "mib_per_s": mib / seconds, "peak_bytes": peak}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, nargs="+", default=[16, 64, 128])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        for megabytes in args.mb:
+            path = os.path.join(tmp, f"{megabytes}.txt")
+            _write_input(path, megabytes)
+            for name, reader in READERS.items():
+                r = measure(reader, path)
+                rss = peak_rss(name, path)
+                print(
+                    f"{megabytes:>5} MiB  {name:<9} {r['seconds']:7.2f}s "
+                    f"{r['mib_per_s']:8.1f} MiB/s  heap {r['peak_bytes'] / (1 << 20):8.1f} MiB"
+                    f"  rss {rss / (1 << 20):8.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
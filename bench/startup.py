@@ -0,0 +1,71 @@
+"""Measure solver cold-start import time with python -X importtime.
+
+Usage: python -m bench.startup
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("networkx", "shapely", "z3", "numpy")
+BUDGET_US = 50_000
+
+
+def import_profile(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and collect -X importtime output.
+    Args:
+        module: Dotted module name (e.g. "day07.solve").
+    Returns:
+        Cumulative import time in microseconds by module name."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (field.strip() for field in line.split("|"))
+        if cumulative.isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def startup_report(day: str) -> dict:
+    """Summarize the cold start of one day's solver.
+    Args:
+        day: Day package name (e.g. "day07").
+    Returns:
+        Dict with cumulative microseconds and heavy modules imported at load."""
+    times = import_profile(f"{day}.solve")
+    return {
+        "day": day,
+        "us": times.get(f"{day}.solve", 0),
+        "heavy": sorted({name.split(".")[0] for name in times} & set(HEAVY_MODULES)),
+    }
+
+
+def days() -> list[str]:
+    """List day packages that have a solver.
+    Returns: Sorted day package names."""
+    return sorted(
+        name
+        for name in os.listdir(ROOT)
+        if name.startswith("day") and os.path.isfile(os.path.join(ROOT, name, "solve.py"))
+    )
+
+
+def main() -> None:
+    for day in days():
+        report = startup_report(day)
+        flag = "" if report["us"] <= BUDGET_US else "  OVER BUDGET"
+        heavy = f"  heavy: {', '.join(report['heavy'])}" if report["heavy"] else ""
+        print(f"{day}  {report['us'] / 1000:7.1f} ms{heavy}{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import random
+import time
+import unittest
+
+from .days import DAYS, VARIANTS
+from .harness import complexity_exponent, measure
+
+
+class TestGenerators(unittest.TestCase):
+    def test_every_case_runs_on_small_input(self):
+        for day, spec in (DAYS | VARIANTS).items():
+            text = spec.generate(max(spec.sizes[0] // 10, 4), random.Random(day))
+            for name, setup in spec.cases().items():
+                with self.subTest(day=day, case=name):
+                    setup(text)()
+
+
+class TestMeasure(unittest.TestCase):
+    def test_first_call_is_not_timed(self):
+        calls = []
+
+        def func():
+            if not calls:
+                time.sleep(0.2)  # stands in for a lazy import
+            calls.append(None)
+
+        seconds, _ = measure(func)
+        self.assertLess(seconds, 0.1)
+        self.assertEqual(len(calls), 3)
+
+
+class TestComplexityExponent(unittest.TestCase):
+    def test_quadratic(self):
+        sizes = [10, 100, 1000]
+        self.assertAlmostEqual(complexity_exponent(sizes, [n * n * 1e-9 for n in sizes]), 2.0)
+
+    def test_undetermined(self):
+        self.assertIsNone(complexity_exponent([10], [1.0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
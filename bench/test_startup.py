@@ -0,0 +1,16 @@
+import unittest
+
+from .startup import days, startup_report
+
+
+class TestStartup(unittest.TestCase):
+    def test_solvers_start_lazily(self):
+        # The import-time budget is timing-dependent; `python -m bench.startup` reports it.
+        for day in days():
+            with self.subTest(day=day):
+                report = startup_report(day)
+                self.assertEqual(report["heavy"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,17 @@
 """Day 1: Secret Entrance - Dial starts at 50, numbers 0-99 (circular)."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from functools import reduce
+from itertools import repeat
+from typing import NamedTuple
+import operator
 import os
 import sys
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import run_parts, parse_lines
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import CHUNK_SIZE, iter_mapped_lines, line_ranges, parse_lines, run_parts
 
 
 def parse(lines: list[str]) -> Iterator[int]:
@@ -91,5 +96,184 @@ class Part2Simulator(DialSimulator):
         self.position = self.position % 100
 
 
+class VectorizedDialSimulator:
+    """Day 1 engine that processes all rotations at once with NumPy."""
+
+    @staticmethod
+    def parse_array(lines: list[str]):
+        """Parse input lines straight into a signed distance array.
+        Args: lines: Raw input lines.
+        Returns: int64 array of distances (L negative)."""
+        import numpy as np
+
+        text = " ".join(lines)
+        distances = np.fromstring(text.replace("R", "").replace("L", "-"), dtype=np.int64, sep=" ")
+        if text.count("R") + text.count("L") != len(distances):
+            raise ValueError("Every rotation must start with exactly one L or R")
+        return distances
+
+    @staticmethod
+    def _start_positions(distances):
+        """Dial position before each rotation.
+        Args: distances: Signed distance array.
+        Returns: int64 array of positions in 0-99."""
+        import numpy as np
+
+        positions = (50 + np.cumsum(distances)) % 100
+        return np.concatenate(([50], positions[:-1]))
+
+    @classmethod
+    def solve_part1(cls, lines: list[str]) -> int:
+        """Count rotations that end on 0.
+        Args: lines: Raw input lines.
+        Returns: Answer for part 1."""
+        import numpy as np
+
+        distances = cls.parse_array(lines)
+        return int(np.count_nonzero((50 + np.cumsum(distances)) % 100 == 0))
+
+    @classmethod
+    def solve_part2(cls, lines: list[str]) -> int:
+        """Count every click that lands on 0, including passes during a rotation.
+        Args: lines: Raw input lines.
+        Returns: Answer for part 2."""
+        import numpy as np
+
+        distances = cls.parse_array(lines)
+        start = cls._start_positions(distances)
+        right = (start + distances) // 100
+        left = ((100 - start) % 100 - distances) // 100
+        return int(np.where(distances > 0, right, left).sum())
+
+
+class ChunkSummary(NamedTuple):
+    """Effect of a run of rotations for every possible start position.
+    Summaries of consecutive chunks combine associatively with +, so a long
+    log can be summarized piecewise (in parallel) and reduced in order.
+    Args:
+        offset: Net rotation modulo 100.
+        landings: Part 1 count (rotations ending on 0) per start position.
+        clicks: Part 2 count (clicks landing on 0) per start position."""
+
+    offset: int = 0
+    landings: tuple[int, ...] = (0,) * 100
+    clicks: tuple[int, ...] = (0,) * 100
+
+    @classmethod
+    def of(cls, distances: Iterable[int]) -> "ChunkSummary":
+        """Summarize rotations in one pass.
+        A rotation from unwrapped position p hits 0 floor((p + d) / 100) - floor(p / 100)
+        times going right. For start s, floor((s + x) / 100) is floor(x / 100) plus 1 when
+        s >= 100 - x % 100, so each term adds a constant and a step over s.
+        Args: distances: Signed rotation distances.
+        Returns: Summary of the rotations."""
+        base = 0
+        steps = [0] * 100
+        residues = [0] * 100
+
+        def add(sign: int, x: int) -> None:
+            nonlocal base
+            base += sign * (x // 100)
+            if x % 100:
+                steps[100 - x % 100] += sign
+
+        position = 0
+        for distance in distances:
+            previous = position
+            position += distance
+            if distance > 0:
+                add(1, position)
+                add(-1, previous)
+            elif distance < 0:
+                add(1, previous - 1)
+                add(-1, position - 1)
+            residues[position % 100] += 1
+
+        clicks = []
+        for step in steps:
+            base += step
+            clicks.append(base)
+        landings = tuple(residues[-start % 100] for start in range(100))
+        return cls(position % 100, landings, tuple(clicks))
+
+    def __add__(self, other: "ChunkSummary") -> "ChunkSummary":
+        """Summary of this chunk followed by another.
+        Args: other: Summary of the next chunk.
+        Returns: Combined summary."""
+        shifted = [(start + self.offset) % 100 for start in range(100)]
+        return ChunkSummary(
+            (self.offset + other.offset) % 100,
+            tuple(a + other.landings[s] for a, s in zip(self.landings, shifted)),
+            tuple(a + other.clicks[s] for a, s in zip(self.clicks, shifted)),
+        )
+
+
+class DialStream:
+    """Resumable Day 1 simulation fed one chunk of rotations at a time.
+    Args:
+        position: Current dial position.
+        part1: Part 1 count so far.
+        part2: Part 2 count so far."""
+
+    def __init__(self, position: int = 50, part1: int = 0, part2: int = 0) -> None:
+        self.position = position
+        self.part1 = part1
+        self.part2 = part2
+
+    def apply(self, summary: ChunkSummary) -> None:
+        """Advance past a summarized chunk.
+        Args: summary: Summary of the next rotations."""
+        self.part1 += summary.landings[self.position]
+        self.part2 += summary.clicks[self.position]
+        self.position = (self.position + summary.offset) % 100
+
+    def feed(self, distances: Iterable[int]) -> None:
+        """Advance past a chunk of rotations.
+        Args: distances: Signed rotation distances (e.g. from parse)."""
+        self.apply(ChunkSummary.of(distances))
+
+    def checkpoint(self) -> dict[str, int]:
+        """Capture the simulator state.
+        Returns: JSON-serializable state."""
+        return {"position": self.position, "part1": self.part1, "part2": self.part2}
+
+    @classmethod
+    def restore(cls, state: dict[str, int]) -> "DialStream":
+        """Resume from a checkpoint.
+        Args: state: State returned by checkpoint.
+        Returns: Simulator continuing from that state."""
+        return cls(**state)
+
+
+def _summarize_range(path: str, byte_range: tuple[int, int]) -> ChunkSummary:
+    """Summarize the rotations in one line-aligned byte range of a file.
+    Args: path: Input file path.
+          byte_range: (start, stop) byte offsets from line_ranges.
+    Returns: Summary of the range."""
+    start, stop = byte_range
+    return ChunkSummary.of(parse(iter_mapped_lines(path, start=start, stop=stop)))
+
+
+def solve_parallel(
+    path: str, workers: int | None = None, chunk_bytes: int = 16 * CHUNK_SIZE
+) -> tuple[int, int]:
+    """Solve both parts of a rotation log by summarizing chunks on a process pool.
+    Args:
+        path: Input file path.
+        workers: Worker processes (default: CPU count).
+        chunk_bytes: Approximate bytes per chunk.
+    Returns:
+        Tuple of (part 1, part 2) answers."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers) as pool:
+        summaries = pool.map(_summarize_range, repeat(path), line_ranges(path, chunk_bytes))
+        stream = DialStream()
+        stream.apply(reduce(operator.add, summaries, ChunkSummary()))
+    return stream.part1, stream.part2
+
+
+PARTS = (Part1Simulator.solve, Part2Simulator.solve)
+
 if __name__ == "__main__":
-    run_parts(Part1Simulator.solve, Part2Simulator.solve)
+    run_parts(*PARTS)
@@ -1,5 +1,16 @@
+import os
+import random
+import tempfile
 import unittest
-from .solve import Part1Simulator, Part2Simulator, parse
+from .solve import (
+    ChunkSummary,
+    DialStream,
+    Part1Simulator,
+    Part2Simulator,
+    VectorizedDialSimulator,
+    parse,
+    solve_parallel,
+)
 
 EXAMPLE = ["L68", "L30", "R48", "L5", "R60", "L55", "L1", "L99", "R14", "L82"]
 
@@ -37,6 +48,50 @@ class TestPart2(unittest.TestCase):
     def test_left_full_circle(self):
         self.assertEqual(Part2Simulator.solve(["R50", "L100"]), 2)
 
+
+class TestVectorized(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(VectorizedDialSimulator.solve_part1(EXAMPLE), 3)
+        self.assertEqual(VectorizedDialSimulator.solve_part2(EXAMPLE), 6)
+
+    def test_matches_simulators(self):
+        rng = random.Random(1)
+        distances = [0, 1, 50, 99, 100, 101, 250, 999]
+        lines = [f"{rng.choice('LR')}{rng.choice(distances)}" for _ in range(2000)]
+        self.assertEqual(VectorizedDialSimulator.solve_part1(lines), Part1Simulator.solve(lines))
+        self.assertEqual(VectorizedDialSimulator.solve_part2(lines), Part2Simulator.solve(lines))
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            VectorizedDialSimulator.solve_part1(["X5"])
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(2)
+        self.lines = [f"{rng.choice('LR')}{rng.randint(0, 350)}" for _ in range(500)]
+        self.expected = (Part1Simulator.solve(self.lines), Part2Simulator.solve(self.lines))
+
+    def test_chunked_feed_with_checkpoint(self):
+        stream = DialStream()
+        for i in range(0, len(self.lines), 70):
+            stream = DialStream.restore(stream.checkpoint())
+            stream.feed(parse(self.lines[i : i + 70]))
+        self.assertEqual((stream.part1, stream.part2), self.expected)
+
+    def test_summaries_combine_associatively(self):
+        a, b, c = (ChunkSummary.of(parse(self.lines[i : i + 200])) for i in (0, 200, 400))
+        self.assertEqual((a + b) + c, a + (b + c))
+        self.assertEqual(a + b + c, ChunkSummary.of(parse(self.lines)))
+
+    def test_solve_parallel(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(self.lines) + "\n")
+            self.assertEqual(solve_parallel(path, workers=2, chunk_bytes=256), self.expected)
+
+
 class TestParsing(unittest.TestCase):
     def test_direction_sign(self):
         self.assertEqual(list(parse(["L1", "R1"])), [-1, 1])
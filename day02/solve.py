@@ -1,11 +1,13 @@
 """Day 2: Gift Shop - Find invalid IDs (digits repeated twice)."""
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from functools import partial
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import run_parts, parse_lines
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import run_parts, merge_ranges, parse_lines
 
 
 def parse(lines: list[str]) -> Iterator[tuple[int, int]]:
@@ -25,6 +27,21 @@ def parse(lines: list[str]) -> Iterator[tuple[int, int]]:
     return parse_lines(lines, parse_line)
 
 
+def segments(lines: list[str]) -> list[tuple[int, int]]:
+    """Normalize input ranges into disjoint segments of a single digit length.
+    Args:
+        lines: Raw input lines containing ranges.
+    Returns:
+        Sorted (start, end) segments; every ID in a segment has the same number of digits."""
+    result = []
+    for start, end in merge_ranges(parse(lines)):
+        while start <= end:
+            stop = min(end, 10 ** len(str(start)) - 1)
+            result.append((start, stop))
+            start = stop + 1
+    return result
+
+
 def is_invalid(n: int) -> bool:
     """Check if ID is invalid (made of same sequence repeated twice).
     Args:
@@ -56,25 +73,121 @@ def is_invalid_v2(n: int) -> bool:
     return False
 
 
+def _sum_invalid_in(is_invalid_func: Callable[[int], bool], segment: tuple[int, int]) -> int:
+    """Sum invalid IDs in one segment by checking every ID.
+    Args:
+        is_invalid_func: Function to check if ID is invalid.
+        segment: (start, end) range.
+    Returns:
+        Sum of invalid IDs in the segment."""
+    start, end = segment
+    return sum(n for n in range(start, end + 1) if is_invalid_func(n))
+
+
 def sum_invalid_ids(lines: list[str], is_invalid_func) -> int:
-    """Sum all invalid IDs in the given ranges.
+    """Sum all invalid IDs in the given ranges (each ID counted once).
     Args:
         lines: Raw input lines containing ranges.
         is_invalid_func: Function to check if ID is invalid.
     Returns:
         Sum of all invalid IDs."""
-    total = 0
+    return sum(_sum_invalid_in(is_invalid_func, segment) for segment in segments(lines))
+
+
+def sum_invalid_ids_parallel(
+    lines: list[str],
+    is_invalid_func: Callable[[int], bool],
+    workers: int | None = None,
+    chunk_size: int = 1_000_000,
+) -> int:
+    """Sum all invalid IDs, spreading the merged segments across a process pool.
+    Args:
+        lines: Raw input lines containing ranges.
+        is_invalid_func: Module-level function to check if ID is invalid.
+        workers: Worker processes (default: CPU count).
+        chunk_size: Maximum IDs checked per task.
+    Returns:
+        Sum of all invalid IDs."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [
+        (lo, min(lo + chunk_size - 1, end))
+        for start, end in segments(lines)
+        for lo in range(start, end + 1, chunk_size)
+    ]
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(partial(_sum_invalid_in, is_invalid_func), chunks))
 
-    for start, end in parse(lines):
-        for n in range(start, end + 1):
-            if is_invalid_func(n):
-                total += n
 
+def _repeat_factor(length: int, period: int) -> int:
+    """Multiplier turning a pattern into its repetition (e.g. 1001 for 12 -> 1212).
+    Args:
+        length: Total number of digits.
+        period: Digits in the repeated pattern (divides length).
+    Returns:
+        1 + 10**period + 10**(2*period) + ... up to length digits."""
+    return sum(10 ** (period * i) for i in range(length // period))
+
+
+def _sum_with_period(lo: int, hi: int, length: int, period: int) -> int:
+    """Sum numbers in [lo, hi] that repeat a period-digit pattern to length digits.
+    Args:
+        lo: Lower bound (at least 10**(length - 1)).
+        hi: Upper bound (below 10**length).
+        length: Number of digits.
+        period: Pattern length (divides length).
+    Returns:
+        Sum of matching numbers, as factor times an arithmetic series of patterns."""
+    factor = _repeat_factor(length, period)
+    first = max(10 ** (period - 1), -(-lo // factor))
+    last = min(10**period - 1, hi // factor)
+    if first > last:
+        return 0
+    return factor * (first + last) * (last - first + 1) // 2
+
+
+def _sum_repeated_in_range(start: int, end: int, twice_only: bool) -> int:
+    """Sum invalid IDs in one range without visiting every integer.
+    Args:
+        start: First ID.
+        end: Last ID.
+        twice_only: True for part 1 (pattern repeated exactly twice).
+    Returns:
+        Sum of invalid IDs in [start, end]."""
+    total = 0
+    # Ranges from segments() have a single length; other callers may span several.
+    for length in range(len(str(start)), len(str(end)) + 1):
+        lo, hi = max(start, 10 ** (length - 1)), min(end, 10**length - 1)
+        if twice_only:
+            if length % 2 == 0:
+                total += _sum_with_period(lo, hi, length, length // 2)
+            continue
+        # Inclusion-exclusion: count each ID once, under its smallest period.
+        exact: dict[int, int] = {}
+        for period in range(1, length // 2 + 1):
+            if length % period == 0:
+                exact[period] = _sum_with_period(lo, hi, length, period) - sum(
+                    value for smaller, value in exact.items() if period % smaller == 0
+                )
+        total += sum(exact.values())
     return total
 
 
+def sum_repeated_ids(lines: list[str], twice_only: bool) -> int:
+    """Sum all invalid IDs in the given ranges arithmetically.
+    Cost depends on the number of digits, not on the width of the ranges.
+    Args:
+        lines: Raw input lines containing ranges.
+        twice_only: True for part 1 (is_invalid), False for part 2 (is_invalid_v2).
+    Returns:
+        Sum of all invalid IDs."""
+    return sum(_sum_repeated_in_range(start, end, twice_only) for start, end in segments(lines))
+
+
+PARTS = (
+    lambda lines: sum_repeated_ids(lines, twice_only=True),
+    lambda lines: sum_repeated_ids(lines, twice_only=False),
+)
+
 if __name__ == "__main__":
-    run_parts(
-        lambda lines: sum_invalid_ids(lines, is_invalid),
-        lambda lines: sum_invalid_ids(lines, is_invalid_v2),
-    )
+    run_parts(*PARTS)
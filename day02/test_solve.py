@@ -1,5 +1,14 @@
+import random
 import unittest
-from .solve import sum_invalid_ids, is_invalid, is_invalid_v2
+from .solve import (
+    sum_invalid_ids,
+    sum_invalid_ids_parallel,
+    sum_repeated_ids,
+    is_invalid,
+    is_invalid_v2,
+    merge_ranges,
+    segments,
+)
 
 EXAMPLE = [
     "11-22,95-115,998-1012,1188511880-1188511890,222220-222224,1698522-1698528,446443-446449,38593856-38593862,565653-565659,824824821-824824827,2121212118-2121212124"
@@ -30,5 +39,48 @@ class TestPart2(unittest.TestCase):
         self.assertFalse(is_invalid_v2(101))  # Not repeated
 
 
+class TestClosedForm(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(sum_repeated_ids(EXAMPLE, twice_only=True), 1227775554)
+        self.assertEqual(sum_repeated_ids(EXAMPLE, twice_only=False), 4174379265)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            start = rng.randint(1, 10 ** rng.randint(1, 6))
+            lines = [f"{start}-{start + rng.randint(0, 5000)}"]
+            with self.subTest(range=lines[0]):
+                self.assertEqual(
+                    sum_repeated_ids(lines, twice_only=True), sum_invalid_ids(lines, is_invalid)
+                )
+                self.assertEqual(
+                    sum_repeated_ids(lines, twice_only=False),
+                    sum_invalid_ids(lines, is_invalid_v2),
+                )
+
+    def test_wide_range(self):
+        # Every 4-digit ID that repeats a 2-digit pattern: 101 * (10 + 11 + ... + 99)
+        self.assertEqual(sum_repeated_ids(["1000-9999"], twice_only=True), 101 * 4905)
+
+
+class TestSegments(unittest.TestCase):
+    def test_merge_ranges(self):
+        self.assertEqual(merge_ranges([(10, 20), (1, 5), (6, 8), (15, 30)]), [(1, 8), (10, 30)])
+
+    def test_split_at_digit_lengths(self):
+        self.assertEqual(segments(["95-1012,100-120"]), [(95, 99), (100, 999), (1000, 1012)])
+
+    def test_overlaps_counted_once(self):
+        for func in (is_invalid, is_invalid_v2):
+            self.assertEqual(sum_invalid_ids(["11-22,11-22,15-33"], func), 11 + 22 + 33)
+        self.assertEqual(sum_repeated_ids(["11-22,11-22,15-33"], twice_only=True), 66)
+
+    def test_parallel(self):
+        self.assertEqual(
+            sum_invalid_ids_parallel(EXAMPLE, is_invalid_v2, workers=2, chunk_size=7),
+            4174379265,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
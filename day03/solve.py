@@ -3,9 +3,70 @@
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run_parts, iter_lines
 
+FIND_BUDGET = 64
+
+
+def _pick_by_find(bank: bytes, k: int) -> int:
+    """Pick k digits greedily, locating each as the leftmost highest digit in its window.
+    Each window is searched with bytes.find from '9' down, so the scan runs in C and
+    usually stops after a few bytes.
+    Args:
+        bank: ASCII digits.
+        k: Number of digits to pick.
+    Returns:
+        Maximum joltage."""
+    n = len(bank)
+    picked = bytearray()
+    start = 0
+    for end in range(n - k + 1, n + 1):
+        for digit in b"987654321":
+            index = bank.find(digit, start, end)
+            if index >= 0:
+                break
+        else:
+            digit, index = bank[start], start
+        picked.append(digit)
+        start = index + 1
+    return int(picked)
+
+
+def _pick_by_stack(bank: bytes, k: int) -> int:
+    """Pick k digits with a monotonic stack in O(n).
+    A digit pops smaller digits off the stack while it may still drop n - k digits.
+    Args:
+        bank: ASCII digits.
+        k: Number of digits to pick.
+    Returns:
+        Maximum joltage."""
+    drop = len(bank) - k
+    stack = bytearray()
+    for digit in bank:
+        while drop and stack and stack[-1] < digit:
+            stack.pop()
+            drop -= 1
+        stack.append(digit)
+    return int(stack[:k])
+
+
+def _max_joltages(bank: bytes, ks: tuple[int, ...]) -> list[int]:
+    """Find max joltage for several k.
+    Short windows use the find-based greedy, whose worst case is O(k * (n - k));
+    otherwise the O(n) monotonic stack bounds the cost.
+    Args:
+        bank: ASCII digits.
+        ks: Numbers of digits to pick.
+    Returns:
+        Maximum joltage for each k."""
+    n = len(bank)
+    return [
+        _pick_by_find(bank, k) if k * (n - k) <= FIND_BUDGET * n else _pick_by_stack(bank, k)
+        for k in ks
+    ]
+
 
 def _max_joltage(bank: str, k: int = 2) -> int:
     """Find max joltage by picking k digits in order.
@@ -14,19 +75,21 @@ def _max_joltage(bank: str, k: int = 2) -> int:
         k: Number of digits to pick.
     Returns:
         Maximum joltage from picking k digits."""
-    digits = [int(c) for c in bank]
-    n = len(digits)
-    result = []
-    start = 0
-    for i in range(k):
-        end = n - k + i + 1
-        best_idx = start
-        for j in range(start, end):
-            if digits[j] > digits[best_idx]:
-                best_idx = j
-        result.append(digits[best_idx])
-        start = best_idx + 1
-    return int("".join(str(d) for d in result))
+    return _max_joltages(bank.encode(), (k,))[0]
+
+
+def solve_many(lines: list[str], ks: tuple[int, ...]) -> list[int]:
+    """Sum of max joltage from each bank for several k in one pass over the input.
+    Args:
+        lines: Raw input lines.
+        ks: Numbers of digits to pick per bank.
+    Returns:
+        Total joltage for each k."""
+    totals = [0] * len(ks)
+    for line in iter_lines(lines):
+        for i, joltage in enumerate(_max_joltages(line.encode(), ks)):
+            totals[i] += joltage
+    return totals
 
 
 def solve(lines: list[str], k: int) -> int:
@@ -36,8 +99,43 @@ def solve(lines: list[str], k: int) -> int:
         k: Number of digits to pick per bank.
     Returns:
         Total joltage."""
-    return sum(_max_joltage(line, k) for line in iter_lines(lines))
+    return solve_many(lines, (k,))[0]
+
+
+def solve_batch(lines: list[str], k: int) -> int:
+    """Sum of max joltage with all banks picked at once on a NumPy digit matrix.
+    Equal-length banks are loaded with a single np.frombuffer; each pick takes the
+    per-row argmax over its window, with columns before the row's last pick masked.
+    Ragged input falls back to per-row picking.
+    Args:
+        lines: Raw input lines.
+        k: Number of digits to pick per bank.
+    Returns:
+        Total joltage."""
+    import numpy as np
+
+    banks = list(iter_lines(lines))
+    if not banks:
+        return 0
+    n = len(banks[0])
+    if any(len(bank) != n for bank in banks):
+        return sum(_max_joltages(bank.encode(), (k,))[0] for bank in banks)
+    digits = np.frombuffer("".join(banks).encode(), dtype=np.uint8).reshape(-1, n)
+    digits = (digits - ord("0")).astype(np.int8)
+    rows = np.arange(len(banks))
+    cols = np.arange(n)
+    start = np.zeros(len(banks), dtype=np.intp)
+    total = 0
+    for end in range(n - k + 1, n + 1):
+        low = int(start.min())
+        window = np.where(cols[low:end] >= start[:, None], digits[:, low:end], -1)
+        picked = window.argmax(axis=1) + low
+        total = total * 10 + int(digits[rows, picked].sum(dtype=np.int64))
+        start = picked + 1
+    return total
+
 
+PARTS = (lambda lines: solve(lines, 2), lambda lines: solve(lines, 12))
 
 if __name__ == "__main__":
-    run_parts(lambda lines: solve(lines, 2), lambda lines: solve(lines, 12))
+    run_parts(*PARTS)
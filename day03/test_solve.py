@@ -1,5 +1,6 @@
+import random
 import unittest
-from .solve import solve, _max_joltage
+from .solve import solve, solve_batch, solve_many, _max_joltage, _pick_by_find, _pick_by_stack
 
 EXAMPLE = ["987654321111111", "811111111111119", "234234234234278", "818181911112111"]
 
@@ -24,5 +25,57 @@ class TestPart2(unittest.TestCase):
         self.assertEqual(_max_joltage("818181911112111", 12), 888911112111)
 
 
+def _max_joltage_brute(bank: str, k: int) -> int:
+    best = ""
+    start = 0
+    for i in range(k):
+        window = bank[start : len(bank) - k + i + 1]
+        best += max(window)
+        start += window.index(max(window)) + 1
+    return int(best)
+
+
+class TestMonotonicStack(unittest.TestCase):
+    def test_solve_many(self):
+        self.assertEqual(solve_many(EXAMPLE, (2, 12)), [357, 3121910778619])
+
+    def test_matches_window_scan(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            bank = "".join(rng.choice("123456789") for _ in range(rng.randint(1, 40)))
+            k = rng.randint(1, len(bank))
+            with self.subTest(bank=bank, k=k):
+                self.assertEqual(_max_joltage(bank, k), _max_joltage_brute(bank, k))
+
+    def test_pickers_agree(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            bank = "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 60)))
+            k = rng.randint(1, len(bank))
+            with self.subTest(bank=bank, k=k):
+                expected = _max_joltage_brute(bank, k)
+                self.assertEqual(_pick_by_find(bank.encode(), k), expected)
+                self.assertEqual(_pick_by_stack(bank.encode(), k), expected)
+
+
+class TestBatch(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(solve_batch(EXAMPLE, 2), 357)
+        self.assertEqual(solve_batch(EXAMPLE, 12), 3121910778619)
+
+    def test_ragged_input(self):
+        lines = EXAMPLE + ["9119"]
+        self.assertEqual(solve_batch(lines, 2), solve(lines, 2))
+
+    def test_matches_solve(self):
+        rng = random.Random(6)
+        for _ in range(20):
+            n = rng.randint(1, 30)
+            lines = ["".join(rng.choice("0123456789") for _ in range(n)) for _ in range(50)]
+            k = rng.randint(1, n)
+            with self.subTest(n=n, k=k):
+                self.assertEqual(solve_batch(lines, k), solve(lines, k))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,13 @@
 """Day 4: Printing Department - Count accessible paper rolls."""
 
+from itertools import repeat
+from typing import NamedTuple
+import mmap
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run_parts, iter_lines
 
 DIRECTIONS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
@@ -26,8 +30,8 @@ def _count_neighbors(grid: list[str], r: int, c: int) -> int:
     return count
 
 
-def solve_part1(lines: list[str]) -> int:
-    """Count rolls accessible (< 4 neighbors).
+def solve_part1_loop(lines: list[str]) -> int:
+    """Count rolls accessible (< 4 neighbors) by checking each cell in Python.
     Args:
         lines: Raw input lines.
     Returns:
@@ -41,8 +45,49 @@ def solve_part1(lines: list[str]) -> int:
     return accessible
 
 
-def solve_part2(lines: list[str]) -> int:
-    """Count total rolls removable by repeatedly removing accessible ones.
+def _roll_mask(lines: list[str]):
+    """Load the grid as a boolean NumPy array of roll positions.
+    Args:
+        lines: Raw input lines.
+    Returns:
+        2D bool array, True where the cell is a roll (@)."""
+    import numpy as np
+
+    rows = list(iter_lines(lines))
+    if not rows:
+        return np.zeros((0, 0), dtype=bool)
+    cells = np.frombuffer("".join(rows).encode(), dtype=np.uint8)
+    return cells.reshape(len(rows), -1) == ord("@")
+
+
+def _neighbor_counts(mask):
+    """Count neighboring rolls for every cell with eight shifted adds.
+    Args:
+        mask: 2D bool array of roll positions.
+    Returns:
+        2D uint8 array of adjacent roll counts."""
+    import numpy as np
+
+    rows, cols = mask.shape
+    padded = np.pad(mask, 1).view(np.uint8)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr, dc in DIRECTIONS:
+        counts += padded[1 + dr : 1 + dr + rows, 1 + dc : 1 + dc + cols]
+    return counts
+
+
+def solve_part1(lines: list[str]) -> int:
+    """Count rolls accessible (< 4 neighbors) on a NumPy grid.
+    Args:
+        lines: Raw input lines.
+    Returns:
+        Number of accessible rolls."""
+    mask = _roll_mask(lines)
+    return int((mask & (_neighbor_counts(mask) < 4)).sum())
+
+
+def solve_part2_rescan(lines: list[str]) -> int:
+    """Count total rolls removable by rescanning the whole grid every round.
     Args:
         lines: Raw input lines.
     Returns:
@@ -66,5 +111,211 @@ def solve_part2(lines: list[str]) -> int:
     return total_removed
 
 
+def _padded_grid(rows: list[str]) -> tuple[bytearray, int]:
+    """Flatten the grid into bytes with a one-cell border of empty floor.
+    Args:
+        rows: Grid rows without line endings.
+    Returns:
+        Flat padded grid and its row width."""
+    width = len(rows[0]) + 2
+    border = b"." * width
+    return bytearray(border + b"".join(b"." + row.encode() + b"." for row in rows) + border), width
+
+
+def _peel(grid: bytearray, width: int, start: int = 0, stop: int | None = None) -> list[int]:
+    """Remove accessible rolls round by round, updating neighbor counts incrementally.
+    Counts are computed once; removing a roll decrements its neighbors and queues
+    those that drop from 4 to 3 for the next round, so every cell is queued at most once.
+    Args:
+        grid: Flat padded grid (see _padded_grid), modified in place.
+        width: Row width of the padded grid.
+        start: First flat index that may be removed; rolls before it stay frozen.
+        stop: Flat index past the last removable cell (default: end of grid).
+    Returns:
+        Number of rolls removed in each round."""
+    roll, empty = ord("@"), ord(".")
+    stop = len(grid) if stop is None else stop
+    offsets = [dr * width + dc for dr, dc in DIRECTIONS]
+    counts = bytearray(len(grid))
+    frontier = []
+    for i in range(start, stop):
+        if grid[i] == roll:
+            counts[i] = count = sum(grid[i + offset] == roll for offset in offsets)
+            if count < 4:
+                frontier.append(i)
+    rounds = []
+    while frontier:
+        for i in frontier:
+            grid[i] = empty
+        rounds.append(len(frontier))
+        queued = []
+        for i in frontier:
+            for offset in offsets:
+                j = i + offset
+                if start <= j < stop and grid[j] == roll:
+                    counts[j] -= 1
+                    if counts[j] == 3:
+                        queued.append(j)
+        frontier = queued
+    return rounds
+
+
+def peel_rounds(lines: list[str]) -> list[int]:
+    """Count rolls removed in each round of repeatedly removing accessible ones.
+    Args:
+        lines: Raw input lines.
+    Returns:
+        Number of rolls removed per round."""
+    rows = list(iter_lines(lines))
+    if not rows:
+        return []
+    return _peel(*_padded_grid(rows))
+
+
+def solve_part2(lines: list[str]) -> int:
+    """Count total rolls removable by repeatedly removing accessible ones.
+    Args:
+        lines: Raw input lines.
+    Returns:
+        Total rolls removed."""
+    return sum(peel_rounds(lines))
+
+
+class GridFile(NamedTuple):
+    """Layout of a grid file with fixed-length rows.
+    Args:
+        path: File path.
+        width: Cells per row.
+        stride: Bytes per row, including the line ending.
+        rows: Number of rows."""
+
+    path: str
+    width: int
+    stride: int
+    rows: int
+
+    @classmethod
+    def of(cls, path: str) -> "GridFile":
+        """Read the layout from the first row of a file.
+        Args: path: Grid file path.
+        Returns: The file's layout."""
+        with open(path, "rb") as f:
+            first = f.readline()
+            size = f.seek(0, os.SEEK_END)
+            # Trailing blank lines are not rows.
+            while size:
+                f.seek(size - 1)
+                if f.read(1) not in b"\r\n":
+                    break
+                size -= 1
+        stride = len(first)
+        return cls(path, len(first.rstrip(b"\r\n")), stride, -(-size // stride) if stride else 0)
+
+    def bands(self, band_rows: int) -> list[tuple[int, int]]:
+        """Split the rows into bands.
+        Args: band_rows: Rows per band.
+        Returns: List of (top, bottom) row ranges."""
+        return [(top, min(top + band_rows, self.rows)) for top in range(0, self.rows, band_rows)]
+
+    def read(self, mm: mmap.mmap, top: int, bottom: int) -> list[str]:
+        """Read a range of rows from the mapped file.
+        Args: mm: Memory map of the file.
+              top: First row.
+              bottom: Row past the last one.
+        Returns: Rows without line endings."""
+        return [
+            mm[r * self.stride : r * self.stride + self.width].decode() for r in range(top, bottom)
+        ]
+
+
+def _count_band(grid: GridFile, band: tuple[int, int]) -> int:
+    """Count accessible rolls in one band, reading a halo row on each side.
+    Args: grid: Grid file layout.
+          band: (top, bottom) row range.
+    Returns: Number of accessible rolls in the band."""
+    top, bottom = band
+    low = max(top - 1, 0)
+    with open(grid.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        rows = grid.read(mm, low, min(bottom + 1, grid.rows))
+    mask = _roll_mask(rows)
+    accessible = mask & (_neighbor_counts(mask) < 4)
+    return int(accessible[top - low : bottom - low].sum())
+
+
+def _peel_band(grid: GridFile, band: tuple[int, int]) -> tuple[int, bool, bool]:
+    """Peel one band of a state file in place, keeping its halo rows frozen.
+    Args: grid: Layout of the state file, which is updated.
+          band: (top, bottom) row range.
+    Returns: Rolls removed, and whether the band's top and bottom rows changed."""
+    top, bottom = band
+    low, high = max(top - 1, 0), min(bottom + 1, grid.rows)
+    with open(grid.path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        rows = grid.read(mm, low, high)
+        cells, width = _padded_grid(rows)
+        start = (top - low + 1) * width
+        removed = sum(_peel(cells, width, start, start + (bottom - top) * width))
+        if not removed:
+            return 0, False, False
+        changed = []
+        for r in range(top, bottom):
+            row = cells[(r - low + 1) * width + 1 : (r - low + 2) * width - 1]
+            changed.append(row != rows[r - low].encode())
+            mm[r * grid.stride : r * grid.stride + grid.width] = row
+    return removed, changed[0], changed[-1]
+
+
+def solve_part1_tiled(path: str, workers: int | None = None, band_rows: int = 1024) -> int:
+    """Count accessible rolls in a memory-mapped grid file, one band per task.
+    Args:
+        path: Grid file path.
+        workers: Worker processes (default: CPU count).
+        band_rows: Rows per band, which bounds each worker's memory.
+    Returns:
+        Number of accessible rolls."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    grid = GridFile.of(path)
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(_count_band, repeat(grid), grid.bands(band_rows)))
+
+
+def solve_part2_tiled(path: str, workers: int | None = None, band_rows: int = 1024) -> int:
+    """Count removable rolls by peeling bands of a scratch copy of the grid file.
+    Bands of one parity run at a time, so no band is written while a neighbor reads
+    it as a halo. A band whose top or bottom row changed marks that neighbor for
+    another pass, until no band changes.
+    Args:
+        path: Grid file path.
+        workers: Worker processes (default: CPU count).
+        band_rows: Rows per band, which bounds each worker's memory.
+    Returns:
+        Total rolls removed."""
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+
+    total = 0
+    with tempfile.TemporaryDirectory() as tmp, ProcessPoolExecutor(workers) as pool:
+        state = os.path.join(tmp, "grid.txt")
+        shutil.copyfile(path, state)
+        grid = GridFile.of(state)
+        bands = grid.bands(band_rows)
+        dirty = set(range(len(bands)))
+        while dirty:
+            for parity in (0, 1):
+                batch = sorted(i for i in dirty if i % 2 == parity)
+                dirty.difference_update(batch)
+                results = pool.map(_peel_band, repeat(grid), [bands[i] for i in batch])
+                for i, (removed, top_changed, bottom_changed) in zip(batch, results):
+                    total += removed
+                    if top_changed and i > 0:
+                        dirty.add(i - 1)
+                    if bottom_changed and i + 1 < len(bands):
+                        dirty.add(i + 1)
+    return total
+
+
+PARTS = (solve_part1, solve_part2)
+
 if __name__ == "__main__":
-    run_parts(solve_part1, solve_part2)
+    run_parts(*PARTS)
@@ -1,5 +1,20 @@
+import os
+import random
+import tempfile
 import unittest
-from .solve import solve_part1, solve_part2, _count_neighbors
+from .solve import (
+    GridFile,
+    solve_part1,
+    solve_part1_loop,
+    solve_part1_tiled,
+    peel_rounds,
+    solve_part2,
+    solve_part2_tiled,
+    solve_part2_rescan,
+    _count_neighbors,
+    _neighbor_counts,
+    _roll_mask,
+)
 
 EXAMPLE = [
     "@.@@",
@@ -19,11 +34,85 @@ class TestPart1(unittest.TestCase):
         self.assertEqual(_count_neighbors(grid, 1, 1), 5)  # middle
 
 
+class TestVectorized(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(solve_part1_loop(EXAMPLE), 6)
+
+    def test_neighbor_counts(self):
+        counts = _neighbor_counts(_roll_mask(EXAMPLE))
+        for r, row in enumerate(EXAMPLE):
+            for c in range(len(row)):
+                self.assertEqual(counts[r, c], _count_neighbors(EXAMPLE, r, c))
+
+    def test_matches_loop(self):
+        rng = random.Random(4)
+        for _ in range(20):
+            rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+            grid = ["".join(rng.choice("@.") for _ in range(cols)) for _ in range(rows)]
+            with self.subTest(grid=grid):
+                self.assertEqual(solve_part1(grid), solve_part1_loop(grid))
+
+
 class TestPart2(unittest.TestCase):
     def test_example(self):
         # Round 1: remove 6, Round 2: remove 3 remaining = 9 total
         self.assertEqual(solve_part2(EXAMPLE), 9)
 
+    def test_peel_rounds(self):
+        self.assertEqual(peel_rounds(EXAMPLE), [6, 3])
+
+    def test_matches_rescan(self):
+        rng = random.Random(5)
+        for _ in range(30):
+            rows, cols = rng.randint(1, 15), rng.randint(1, 15)
+            grid = [
+                "".join("@" if rng.random() < 0.7 else "." for _ in range(cols))
+                for _ in range(rows)
+            ]
+            with self.subTest(grid=grid):
+                self.assertEqual(solve_part2(grid), solve_part2_rescan(grid))
+
+
+class TestTiled(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "input.txt")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, grid: list[str], end: str = "\n"):
+        with open(self.path, "w") as f:
+            f.write("\n".join(grid) + end)
+
+    def test_grid_file(self):
+        self.write(EXAMPLE)
+        grid = GridFile.of(self.path)
+        self.assertEqual(grid[1:], (4, 5, 3))
+        self.assertEqual(grid.bands(2), [(0, 2), (2, 3)])
+
+    def test_example(self):
+        self.write(EXAMPLE)
+        self.assertEqual(solve_part1_tiled(self.path, workers=2, band_rows=1), 6)
+        self.assertEqual(solve_part2_tiled(self.path, workers=2, band_rows=1), 9)
+
+    def test_trailing_blank_line(self):
+        self.write(EXAMPLE, end="\n\n")
+        self.assertEqual(GridFile.of(self.path).rows, 3)
+        self.assertEqual(solve_part1_tiled(self.path, workers=2, band_rows=2), 6)
+        self.assertEqual(solve_part2_tiled(self.path, workers=2, band_rows=2), 9)
+
+    def test_matches_in_memory(self):
+        rng = random.Random(6)
+        grid = [
+            "".join("@" if rng.random() < 0.75 else "." for _ in range(20)) for _ in range(30)
+        ]
+        self.write(grid)
+        with open(self.path) as f:
+            self.assertEqual(solve_part2_tiled(self.path, workers=2, band_rows=3), solve_part2(f))
+        with open(self.path) as f:
+            self.assertEqual(solve_part1_tiled(self.path, workers=2, band_rows=4), solve_part1(f))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,15 @@
 """Day 5: Cafeteria - Check which ingredients are fresh."""
 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+import struct
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import run_parts
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import run_parts, merge_ranges
 
 
 def _parse(lines: list[str]) -> tuple[list[tuple[int, int]], list[int]]:
@@ -42,14 +47,220 @@ def _is_fresh(n: int, ranges: list[tuple[int, int]]) -> bool:
     return False
 
 
+class IntervalIndex:
+    """Sorted, merged ranges answering membership queries by binary search.
+    Args:
+        ranges: (start, end) inclusive ranges, possibly overlapping."""
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        merged = merge_ranges(ranges)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+        self.total = sum(end - start + 1 for start, end in merged)
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __contains__(self, n: int) -> bool:
+        i = bisect_right(self.starts, n) - 1
+        return i >= 0 and n <= self.ends[i]
+
+    def _as_arrays(self):
+        """Build (and cache) NumPy copies of the bounds for batch queries.
+        Returns: Tuple of (starts, ends) int64 arrays."""
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = (
+                np.array(self.starts, dtype=np.int64),
+                np.array(self.ends, dtype=np.int64),
+            )
+        return self._arrays
+
+    def contains_many(self, ids):
+        """Check a batch of IDs with one np.searchsorted.
+        Args:
+            ids: Array-like of int64 IDs.
+        Returns:
+            Bool array, True where the ID falls in a range."""
+        import numpy as np
+
+        starts, ends = self._as_arrays()
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(starts):
+            return np.zeros(ids.shape, dtype=bool)
+        i = np.searchsorted(starts, ids, side="right") - 1
+        return (i >= 0) & (ids <= ends[np.maximum(i, 0)])
+
+    def count(self, ids) -> int:
+        """Count IDs that fall in a range.
+        Args:
+            ids: Array-like of int64 IDs.
+        Returns:
+            Number of IDs covered."""
+        return int(self.contains_many(ids).sum())
+
+
+class RangeSet(IntervalIndex):
+    """Mutable set of disjoint ranges with a binary file format.
+    Inserting or deleting a range binary-searches the overlapping run of ranges and
+    replaces it with one slice assignment, so small updates skip a full re-merge.
+    Args:
+        ranges: Initial (start, end) inclusive ranges, possibly overlapping."""
+
+    MAGIC = b"RSET"
+    HEADER = struct.Struct("<4sQ")
+
+    def _replace(self, lo: int, hi: int, pieces: list[tuple[int, int]]) -> None:
+        """Replace ranges [lo, hi) with new disjoint pieces, keeping the total in step.
+        Args: lo: First replaced range.
+              hi: Index past the last replaced range.
+              pieces: Sorted ranges to insert in their place."""
+        self.total -= sum(self.ends[i] - self.starts[i] + 1 for i in range(lo, hi))
+        self.total += sum(end - start + 1 for start, end in pieces)
+        self.starts[lo:hi] = [start for start, _ in pieces]
+        self.ends[lo:hi] = [end for _, end in pieces]
+        self._arrays = None
+
+    def add(self, start: int, end: int) -> None:
+        """Insert a range, merging any ranges it overlaps or touches.
+        Args:
+            start: First ID.
+            end: Last ID (inclusive)."""
+        lo = bisect_left(self.ends, start - 1)
+        hi = bisect_right(self.starts, end + 1)
+        if lo < hi:
+            start, end = min(start, self.starts[lo]), max(end, self.ends[hi - 1])
+        self._replace(lo, hi, [(start, end)])
+
+    def remove(self, start: int, end: int) -> None:
+        """Delete a range, trimming or splitting the ranges it overlaps.
+        Args:
+            start: First ID.
+            end: Last ID (inclusive)."""
+        lo = bisect_left(self.ends, start)
+        hi = bisect_right(self.starts, end)
+        if lo >= hi:
+            return
+        pieces = []
+        if self.starts[lo] < start:
+            pieces.append((self.starts[lo], start - 1))
+        if self.ends[hi - 1] > end:
+            pieces.append((end + 1, self.ends[hi - 1]))
+        self._replace(lo, hi, pieces)
+
+    def save(self, path: str) -> None:
+        """Write the ranges as a header and interleaved int64 bounds.
+        Args:
+            path: Output file path."""
+        bounds = array("q", [bound for pair in self for bound in pair])
+        if sys.byteorder == "big":
+            bounds.byteswap()
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, len(self)))
+            bounds.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "RangeSet":
+        """Read ranges written by save without re-merging them.
+        Args:
+            path: File written by save.
+        Returns:
+            The loaded range set."""
+        with open(path, "rb") as f:
+            magic, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a range set file")
+            bounds = array("q")
+            bounds.fromfile(f, 2 * count)
+        if sys.byteorder == "big":
+            bounds.byteswap()
+        ranges = cls()
+        ranges.starts = bounds[0::2].tolist()
+        ranges.ends = bounds[1::2].tolist()
+        ranges.total = sum(ranges.ends) - sum(ranges.starts) + count
+        return ranges
+
+
+def _read_index(lines: Iterator[str]) -> IntervalIndex:
+    """Consume the range section and build its index.
+    Args:
+        lines: Line iterator, left positioned after the blank separator line.
+    Returns:
+        Index over the fresh ranges."""
+    ranges = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            break
+        start, end = line.split("-")
+        ranges.append((int(start), int(end)))
+    return IntervalIndex(ranges)
+
+
+def iter_id_chunks(lines: Iterable[str], chunk_lines: int = 1 << 16) -> Iterator:
+    """Parse ingredient IDs in bulk, a bounded number of lines at a time.
+    Args:
+        lines: ID section lines.
+        chunk_lines: Lines parsed per chunk.
+    Yields:
+        int64 arrays of IDs."""
+    import numpy as np
+
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == chunk_lines:
+            yield np.fromstring("\n".join(chunk), dtype=np.int64, sep=" ")
+            chunk.clear()
+    if chunk:
+        yield np.fromstring("\n".join(chunk), dtype=np.int64, sep=" ")
+
+
+def count_fresh(lines: Iterable[str], chunk_lines: int = 1 << 16) -> int:
+    """Count fresh IDs while streaming, holding only the ranges and one chunk of IDs.
+    Args:
+        lines: Raw input lines (e.g. a file or MappedLines).
+        chunk_lines: ID lines parsed per chunk.
+    Returns:
+        Number of fresh ingredients."""
+    lines = iter(lines)
+    index = _read_index(lines)
+    return sum(index.count(ids) for ids in iter_id_chunks(lines, chunk_lines))
+
+
 def solve_part1(lines: list[str]) -> int:
     """Count fresh ingredient IDs.
+    Args:
+        lines: Raw input lines.
+    Returns:
+        Number of fresh ingredients."""
+    return count_fresh(lines)
+
+
+def solve_part1_bisect(lines: list[str]) -> int:
+    """Count fresh ingredient IDs with one bisect per ID.
     Args:
         lines: Raw input lines.
     Returns:
         Number of fresh ingredients."""
     ranges, ids = _parse(lines)
-    return sum(1 for n in ids if _is_fresh(n, ranges))
+    index = IntervalIndex(ranges)
+    return sum(1 for n in ids if n in index)
+
+
+def solve_part1_batch(lines: list[str]) -> int:
+    """Count fresh ingredient IDs with a vectorized index lookup.
+    Args:
+        lines: Raw input lines.
+    Returns:
+        Number of fresh ingredients."""
+    ranges, ids = _parse(lines)
+    return IntervalIndex(ranges).count(ids)
 
 
 def solve_part2(lines: list[str]) -> int:
@@ -59,18 +270,10 @@ def solve_part2(lines: list[str]) -> int:
     Returns:
         Total unique fresh IDs."""
     ranges, _ = _parse(lines)
-    ranges.sort()
-
-    # Merge overlapping ranges
-    merged = []
-    for start, end in ranges:
-        if merged and start <= merged[-1][1] + 1:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-        else:
-            merged.append((start, end))
+    return IntervalIndex(ranges).total
 
-    return sum(end - start + 1 for start, end in merged)
 
+PARTS = (solve_part1, solve_part2)
 
 if __name__ == "__main__":
-    run_parts(solve_part1, solve_part2)
+    run_parts(*PARTS)
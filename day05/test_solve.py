@@ -1,5 +1,18 @@
+import os
+import random
+import tempfile
 import unittest
-from .solve import solve_part1, solve_part2, _is_fresh
+from .solve import (
+    IntervalIndex,
+    RangeSet,
+    count_fresh,
+    iter_id_chunks,
+    solve_part1,
+    solve_part1_batch,
+    solve_part1_bisect,
+    solve_part2,
+    _is_fresh,
+)
 
 EXAMPLE = [
     "1-5",
@@ -31,5 +44,103 @@ class TestPart2(unittest.TestCase):
         self.assertEqual(solve_part2(EXAMPLE), 14)
 
 
+class TestIntervalIndex(unittest.TestCase):
+    def test_merges_ranges(self):
+        index = IntervalIndex([(10, 15), (1, 5), (3, 8), (16, 16)])
+        self.assertEqual((index.starts, index.ends), ([1, 10], [8, 16]))
+        self.assertEqual(index.total, 15)
+
+    def test_membership(self):
+        index = IntervalIndex([(1, 5), (10, 15)])
+        ids = [0, 1, 5, 7, 10, 15, 16]
+        expected = [False, True, True, False, True, True, False]
+        self.assertEqual([n in index for n in ids], expected)
+        self.assertEqual(index.contains_many(ids).tolist(), expected)
+
+    def test_empty(self):
+        index = IntervalIndex()
+        self.assertNotIn(3, index)
+        self.assertEqual(index.count([1, 2]), 0)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(5)
+        ranges = [(start, start + rng.randint(0, 20)) for start in rng.sample(range(500), 40)]
+        ids = [rng.randint(-5, 530) for _ in range(300)]
+        index = IntervalIndex(ranges)
+        expected = [_is_fresh(n, ranges) for n in ids]
+        self.assertEqual([n in index for n in ids], expected)
+        self.assertEqual(index.contains_many(ids).tolist(), expected)
+
+    def test_batch_example(self):
+        self.assertEqual(solve_part1_batch(EXAMPLE), 3)
+
+
+class TestRangeSet(unittest.TestCase):
+    def test_add_merges(self):
+        ranges = RangeSet([(1, 5), (10, 15)])
+        ranges.add(6, 9)
+        self.assertEqual(list(ranges), [(1, 15)])
+        self.assertEqual(ranges.total, 15)
+
+    def test_remove_splits(self):
+        ranges = RangeSet([(1, 15)])
+        ranges.remove(5, 7)
+        self.assertEqual(list(ranges), [(1, 4), (8, 15)])
+        self.assertEqual(ranges.total, 12)
+        self.assertNotIn(6, ranges)
+
+    def test_matches_set_model(self):
+        rng = random.Random(7)
+        ranges, model = RangeSet(), set()
+        for _ in range(300):
+            start = rng.randint(0, 100)
+            end = start + rng.randint(0, 15)
+            if rng.random() < 0.6:
+                ranges.add(start, end)
+                model.update(range(start, end + 1))
+            else:
+                ranges.remove(start, end)
+                model.difference_update(range(start, end + 1))
+            self.assertEqual(ranges.total, len(model))
+            self.assertEqual(list(ranges), list(IntervalIndex((n, n) for n in model)))
+        ids = list(range(-1, 120))
+        self.assertEqual(ranges.contains_many(ids).tolist(), [n in model for n in ids])
+
+    def test_mutation_refreshes_batch_lookup(self):
+        ranges = RangeSet([(1, 5)])
+        self.assertEqual(ranges.count([3, 8]), 1)
+        ranges.add(8, 8)
+        self.assertEqual(ranges.count([3, 8]), 2)
+
+    def test_save_load(self):
+        ranges = RangeSet([(1, 5), (10, 15), (2**40, 2**41)])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fresh.rset")
+            ranges.save(path)
+            loaded = RangeSet.load(path)
+        self.assertEqual(list(loaded), list(ranges))
+        self.assertEqual(loaded.total, ranges.total)
+
+
+class TestStreaming(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(solve_part1_bisect(EXAMPLE), 3)
+        self.assertEqual(count_fresh(iter(EXAMPLE), chunk_lines=3), 3)
+
+    def test_id_chunks(self):
+        chunks = iter_id_chunks(["2\n", "7\n", "\n", "9\n", "12"], chunk_lines=2)
+        self.assertEqual([chunk.tolist() for chunk in chunks], [[2, 7], [9], [12]])
+
+    def test_no_ids(self):
+        self.assertEqual(count_fresh(["1-5\n", "\n"]), 0)
+        self.assertEqual(count_fresh(["1-5\n"]), 0)
+
+    def test_matches_bisect(self):
+        rng = random.Random(8)
+        lines = [f"{start}-{start + rng.randint(0, 50)}\n" for start in rng.sample(range(1000), 30)]
+        lines += ["\n"] + [f"{rng.randint(0, 1100)}\n" for _ in range(500)]
+        self.assertEqual(count_fresh(lines, chunk_lines=7), solve_part1_bisect(lines))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,21 @@
 """Day 6: Trash Compactor - Solve cephalopod math problems."""
 
+from itertools import chain, islice
+import math
+import mmap
 import sys
 import os
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import run_parts
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import run
+
+PRODUCT_TREE_MIN = 16
+PARALLEL_MIN_PROBLEMS = 8192
+BATCH_SIZE = 256
 
 
 def _preprocess_lines(lines: list[str]) -> tuple[list[str], str, int]:
@@ -189,12 +198,36 @@ def _parse_problems(
     return problems
 
 
-def _solve_problem(numbers: list[int], operation: str) -> int:
+def _product(numbers: list[int], modulus: int | None = None) -> int:
+    """Multiply numbers, pairing operands of similar size for large inputs.
+    Args:
+        numbers: Factors.
+        modulus: If given, reduce the product modulo this value.
+    Returns:
+        Product of the numbers (mod modulus)."""
+    if modulus is not None:
+        result = 1 % modulus
+        for n in numbers:
+            result = result * n % modulus
+        return result
+    if len(numbers) <= PRODUCT_TREE_MIN:
+        return math.prod(numbers)
+    # Balanced product tree: multiplying equal-sized halves keeps big-int growth near-linear
+    while len(numbers) > 1:
+        paired = [a * b for a, b in zip(numbers[0::2], numbers[1::2])]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+
+def _solve_problem(numbers: list[int], operation: str, modulus: int | None = None) -> int:
     """Solve a single problem.
 
     Args:
         numbers: List of numbers in the problem.
         operation: Operation to perform ('+' or '*').
+        modulus: If given, reduce the answer modulo this value.
     Returns:
         Result of the problem.
     """
@@ -202,28 +235,61 @@ def _solve_problem(numbers: list[int], operation: str) -> int:
         return 0
 
     if operation == "+":
-        return sum(numbers)
+        total = sum(numbers)
+        return total if modulus is None else total % modulus
     elif operation == "*":
-        result = 1
-        for n in numbers:
-            result *= n
-        return result
+        return _product(numbers, modulus)
     else:
         raise ValueError(f"Unknown operation: {operation}")
 
 
-def _calculate_grand_total(problems: list[tuple[list[int], str]]) -> int:
+def _batch_total(batch: Iterable[tuple[list[int], str]], modulus: int | None = None) -> int:
+    """Sum the answers of a batch of problems.
+    Args: batch: Iterable of (numbers, operation) tuples.
+          modulus: If given, reduce the sum modulo this value.
+    Returns: Sum of the problem answers (mod modulus)."""
+    total = sum(_solve_problem(numbers, operation, modulus) for numbers, operation in batch)
+    return total if modulus is None else total % modulus
+
+
+def _calculate_grand_total(
+    problems: Iterable[tuple[list[int], str]],
+    modulus: int | None = None,
+    workers: int | None = None,
+) -> int:
     """Calculate grand total from all problems.
 
+    Sheets with fewer than PARALLEL_MIN_PROBLEMS problems are solved in-process.
+    Larger ones are spread across a process pool in batches, with a bounded
+    number in flight so streamed problems are not all held at once.
+
     Args:
-        problems: List of (numbers, operation) tuples.
+        problems: Iterable of (numbers, operation) tuples.
+        modulus: If given, return the grand total modulo this value.
+        workers: Worker processes for large sheets (default: CPU count; 1 solves
+            everything in-process).
     Returns:
         Grand total (sum of all problem answers).
     """
+    problems = iter(problems)
+    head = list(islice(problems, PARALLEL_MIN_PROBLEMS))
+    if workers == 1 or len(head) < PARALLEL_MIN_PROBLEMS:
+        return _batch_total(chain(head, problems), modulus)
+    problems = chain(head, problems)
+
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
     total = 0
-    for numbers, operation in problems:
-        total += _solve_problem(numbers, operation)
-    return total
+    limit = 2 * (workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        while batch := list(islice(problems, BATCH_SIZE)):
+            pending.add(pool.submit(_batch_total, batch, modulus))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                total += sum(future.result() for future in done)
+        total += sum(future.result() for future in pending)
+    return total if modulus is None else total % modulus
 
 
 def solve_part1(lines: list[str]) -> int:
@@ -260,5 +326,189 @@ def solve_part2(lines: list[str]) -> int:
     return _calculate_grand_total(problems)
 
 
+class Problem(NamedTuple):
+    """One worksheet problem read both ways.
+    Args:
+        rows: Numbers read horizontally, top to bottom (part 1).
+        columns: Numbers read vertically, left to right (part 2).
+        operation: '+' or '*'."""
+
+    rows: list[int]
+    columns: list[int]
+    operation: str
+
+
+def _problem_spans(grid) -> list[tuple[int, int]]:
+    """Find problem column spans from separator columns in one vectorized reduction.
+    Args:
+        grid: 2D uint8 array of the worksheet, padded with spaces.
+    Returns:
+        List of (start_col, end_col) spans."""
+    import numpy as np
+
+    separator = (grid == ord(" ")).all(axis=0)
+    edges = np.flatnonzero(np.diff(np.concatenate(([True], separator, [True])).astype(np.int8)))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+
+def scan_problems(grid) -> list[Problem]:
+    """Read every problem of a worksheet array in one pass.
+    Args:
+        grid: 2D uint8 array; the last row holds the operations.
+    Returns:
+        Problems in left-to-right order."""
+    height = grid.shape[0] - 1
+    rows = [row.tobytes() for row in grid[:-1]]
+    columns = grid[:-1].T.tobytes()
+    operations = grid[-1].tobytes().decode()
+    problems = []
+    for start, end in _problem_spans(grid):
+        horizontal = [int(tokens[0]) for row in rows if (tokens := row[start:end].split())]
+        vertical = [
+            int(digits)
+            for col in range(start, end)
+            if (digits := columns[col * height : (col + 1) * height].replace(b" ", b""))
+        ]
+        operation = next((op for op in operations[start:end] if op in "+*"), None)
+        if horizontal and operation:
+            problems.append(Problem(horizontal, vertical, operation))
+    return problems
+
+
+def _byte_grid(lines: list[bytes], width: int):
+    """Stack byte rows into a 2D array, padding short rows with spaces.
+    Args:
+        lines: Rows without line endings.
+        width: Array width; longer rows are cut.
+    Returns:
+        2D uint8 array."""
+    import numpy as np
+
+    grid = np.full((len(lines), width), ord(" "), dtype=np.uint8)
+    for r, line in enumerate(lines):
+        line = line[:width]
+        grid[r, : len(line)] = np.frombuffer(line, dtype=np.uint8)
+    return grid
+
+
+def parse(f: Iterable[str]) -> list[Problem]:
+    """Load the worksheet into a 2D byte array and scan its problems.
+    Args:
+        f: Worksheet lines (e.g. a file handle).
+    Returns:
+        Problems in left-to-right order."""
+    lines = [line.rstrip().encode() for line in f if line.strip()]
+    if len(lines) < 2:
+        return []
+    return scan_problems(_byte_grid(lines, max(map(len, lines))))
+
+
+def _line_spans(mm: mmap.mmap) -> list[tuple[int, int]]:
+    """Locate the non-blank lines of a mapped worksheet.
+    Args: mm: Memory map of the file.
+    Returns: (offset, length) of each line, trailing whitespace excluded."""
+    spans = []
+    start = 0
+    while start < len(mm):
+        stop = mm.find(b"\n", start)
+        stop = len(mm) if stop == -1 else stop
+        end = stop
+        while end > start and mm[end - 1] in b" \t\r":
+            end -= 1
+        if end > start:
+            spans.append((start, end - start))
+        start = stop + 1
+    return spans
+
+
+def iter_problems(path: str, block_cols: int = 1 << 16) -> Iterator[Problem]:
+    """Stream problems from a worksheet file one column block at a time.
+    Each block is cut after its last complete problem and the next block starts
+    there; a block too narrow for a single problem is widened, so memory is bounded
+    by max(block_cols, widest problem) times the number of lines.
+    Args:
+        path: Worksheet file path.
+        block_cols: Columns read per block.
+    Yields:
+        Problems in left-to-right order."""
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = _line_spans(mm)
+        if len(lines) < 2:
+            return
+        width = max(length for _, length in lines)
+        col = 0
+        while col < width:
+            stop = min(col + block_cols, width)
+            rows = [mm[offset + col : offset + min(stop, length)] for offset, length in lines]
+            grid = _byte_grid(rows, stop - col)
+            cut = grid.shape[1]
+            if stop < width:
+                spans = _problem_spans(grid)
+                if spans and spans[-1][1] == cut:
+                    cut = spans[-1][0]
+                if cut == 0:
+                    block_cols *= 2
+                    continue
+            yield from scan_problems(grid[:, :cut])
+            col += cut
+
+
+def solve_streaming(
+    path: str,
+    block_cols: int = 1 << 16,
+    modulus: int | None = None,
+    workers: int | None = None,
+) -> tuple[int, int]:
+    """Solve both parts of a worksheet file without loading it whole.
+    Args:
+        path: Worksheet file path.
+        block_cols: Columns read per block.
+        modulus: If given, reduce the grand totals modulo this value.
+        workers: Worker processes for large sheets (1 solves in-process).
+    Returns:
+        Tuple of (part 1, part 2) grand totals."""
+    return (
+        _calculate_grand_total(
+            ((p.rows, p.operation) for p in iter_problems(path, block_cols)), modulus, workers
+        ),
+        _calculate_grand_total(
+            ((p.columns, p.operation) for p in iter_problems(path, block_cols)), modulus, workers
+        ),
+    )
+
+
+def total_horizontal(
+    problems: list[Problem], modulus: int | None = None, workers: int | None = None
+) -> int:
+    """Grand total with numbers read across rows (part 1).
+    Args:
+        problems: Parsed problems.
+        modulus: If given, reduce the grand total modulo this value.
+        workers: Worker processes for large sheets (1 solves in-process).
+    Returns:
+        Grand total."""
+    return _calculate_grand_total(((p.rows, p.operation) for p in problems), modulus, workers)
+
+
+def total_vertical(
+    problems: list[Problem], modulus: int | None = None, workers: int | None = None
+) -> int:
+    """Grand total with numbers read down columns, right to left (part 2).
+    Args:
+        problems: Parsed problems.
+        modulus: If given, reduce the grand total modulo this value.
+        workers: Worker processes for large sheets (1 solves in-process).
+    Returns:
+        Grand total."""
+    return _calculate_grand_total(
+        ((p.columns, p.operation) for p in reversed(problems)), modulus, workers
+    )
+
+
+PARSE = parse
+PARTS = (total_horizontal, total_vertical)
+
 if __name__ == "__main__":
-    run_parts(solve_part1, solve_part2)
+    run(__file__, PARSE, *PARTS)
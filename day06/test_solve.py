@@ -1,10 +1,23 @@
+import math
+import os
+import random
+import tempfile
 import unittest
+from unittest import mock
 from .solve import (
+    Problem,
+    iter_problems,
+    solve_streaming,
+    parse,
+    total_horizontal,
+    total_vertical,
     solve_part1,
     solve_part2,
     _parse_problems,
     _extract_numbers_part1,
     _extract_operation_part1,
+    _calculate_grand_total,
+    _product,
     _solve_problem,
 )
 
@@ -67,5 +80,106 @@ class TestPart2(unittest.TestCase):
         self.assertEqual(result, 3263827)
 
 
+def _random_sheet(rng: random.Random, count: int, rows: int) -> list[str]:
+    lines = [[] for _ in range(rows + 1)]
+    for _ in range(count):
+        width = rng.randint(1, 4)
+        for row in range(rows):
+            number = str(rng.randint(1, 10 ** rng.randint(0, width - 1)))
+            lines[row].append(number.ljust(width) if rng.random() < 0.5 else number.rjust(width))
+        lines[rows].append(rng.choice("+*").ljust(width))
+    return [" ".join(cells) for cells in lines]
+
+
+class TestScanner(unittest.TestCase):
+    def test_parse(self):
+        problems = parse(EXAMPLE)
+        self.assertEqual(problems[0], Problem([123, 45, 6], [1, 24, 356], "*"))
+        self.assertEqual(problems[3], Problem([64, 23, 314], [623, 431, 4], "+"))
+
+    def test_totals(self):
+        problems = parse(EXAMPLE)
+        self.assertEqual(total_horizontal(problems), 4277556)
+        self.assertEqual(total_vertical(problems), 3263827)
+
+    def test_matches_line_solvers(self):
+        rng = random.Random(9)
+        for _ in range(10):
+            lines = _random_sheet(rng, 50, rng.randint(1, 5))
+            problems = parse(lines)
+            self.assertEqual(total_horizontal(problems), solve_part1(lines))
+            self.assertEqual(total_vertical(problems), solve_part2(lines))
+
+    def test_empty(self):
+        self.assertEqual(parse([]), [])
+
+
+class TestStreaming(unittest.TestCase):
+    def test_example(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(EXAMPLE) + "\n")
+            self.assertEqual(solve_streaming(path, block_cols=2), (4277556, 3263827))
+
+    def test_matches_parse(self):
+        rng = random.Random(10)
+        lines = _random_sheet(rng, 200, 4)
+        lines[1] = lines[1].rstrip()
+        expected = parse(lines)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            for block_cols in (1, 7, 64, 1 << 16):
+                with self.subTest(block_cols=block_cols):
+                    self.assertEqual(list(iter_problems(path, block_cols)), expected)
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            with open(path, "w") as f:
+                f.write("\n")
+            self.assertEqual(list(iter_problems(path)), [])
+
+
+class TestProducts(unittest.TestCase):
+    def test_product_tree(self):
+        rng = random.Random(11)
+        for length in (0, 1, 2, 16, 17, 100):
+            numbers = [rng.randint(1, 10**30) for _ in range(length)]
+            with self.subTest(length=length):
+                self.assertEqual(_product(numbers), math.prod(numbers))
+                self.assertEqual(_product(numbers, 97), math.prod(numbers) % 97)
+
+    def test_modulus(self):
+        problems = parse(EXAMPLE)
+        self.assertEqual(total_horizontal(problems, 1000), 4277556 % 1000)
+        self.assertEqual(total_vertical(problems, 1000), 3263827 % 1000)
+        self.assertEqual(_solve_problem([5], "*", 1), 0)
+
+    def test_parallel_batches(self):
+        problems = parse(_random_sheet(random.Random(12), 300, 5))
+        expected = total_vertical(problems)
+        with (
+            mock.patch("day06.solve.PARALLEL_MIN_PROBLEMS", 20),
+            mock.patch("day06.solve.BATCH_SIZE", 7),
+        ):
+            self.assertEqual(total_vertical(problems), expected)
+            self.assertEqual(
+                _calculate_grand_total(((p.columns, p.operation) for p in problems), 10**9, 2),
+                expected % 10**9,
+            )
+
+    def test_single_worker_stays_in_process(self):
+        problems = parse(_random_sheet(random.Random(13), 300, 5))
+        expected = total_vertical(problems)
+        with (
+            mock.patch("day06.solve.PARALLEL_MIN_PROBLEMS", 20),
+            mock.patch("concurrent.futures.ProcessPoolExecutor", side_effect=AssertionError),
+        ):
+            self.assertEqual(total_vertical(problems, workers=1), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
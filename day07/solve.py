@@ -1,11 +1,19 @@
 """Day 7: Laboratories - Traverse tachyon manifold grid."""
 
+from array import array
+from collections.abc import Iterable
+import struct
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run
 
+# bytes.translate tables mapping each cell to an ASCII bit: splitters, and cells a beam passes
+SPLIT_BITS = bytes(ord("1") if b == ord("^") else ord("0") for b in range(256))
+PASS_BITS = bytes(ord("1") if b in b".S" else ord("0") for b in range(256))
+
 
 def parse(f) -> tuple[tuple[str, ...], int, int, int]:
     """Parse grid and compute dimensions.
@@ -18,8 +26,8 @@ def parse(f) -> tuple[tuple[str, ...], int, int, int]:
     return grid, start_col, len(grid), len(grid[0])
 
 
-def count_visited(parsed) -> int:
-    """Count ^ cells visited during traversal.
+def count_visited_recursive(parsed) -> int:
+    """Count ^ cells visited during a recursive traversal (reference for sweep).
     Args:
         parsed: Tuple of (grid, start_col, rows, cols).
     Returns:
@@ -47,8 +55,8 @@ def count_visited(parsed) -> int:
     return count
 
 
-def count_paths(parsed) -> int:
-    """Count total timelines (paths) through the manifold.
+def count_paths_recursive(parsed) -> int:
+    """Count total timelines (paths) with memoized recursion (reference for sweep).
     Args:
         parsed: Tuple of (grid, start_col, rows, cols).
     Returns:
@@ -76,5 +84,302 @@ def count_paths(parsed) -> int:
     return recurse(0, start_col)
 
 
+def _row_masks(row: str) -> tuple[int, int]:
+    """Encode a row as column bitsets (bit c is column c).
+    Args:
+        row: Grid row.
+    Returns:
+        Tuple of (splitter mask, pass-through mask)."""
+    cells = row.encode()[::-1]
+    return int(cells.translate(SPLIT_BITS) or b"0", 2), int(cells.translate(PASS_BITS) or b"0", 2)
+
+
+def _advance_paths(paths: dict[int, int], row: str, cols: int) -> dict[int, int]:
+    """Move path counts through one row to the row below.
+    Args:
+        paths: Path count by column for beams entering the row.
+        row: Grid row.
+        cols: Grid width.
+    Returns:
+        Path count by column entering the next row."""
+    advanced: dict[int, int] = {}
+    for col, count in paths.items():
+        char = row[col] if col < len(row) else ""
+        if char == "^":
+            for side in (col - 1, col + 1):
+                if 0 <= side < cols:
+                    advanced[side] = advanced.get(side, 0) + count
+        elif char and char in ".S":
+            advanced[col] = advanced.get(col, 0) + count
+    return advanced
+
+
+def _advance_beams(beams: int, row: str, full: int) -> tuple[int, int]:
+    """Move a beam bitset through one row.
+    Args:
+        beams: Bitset of beam columns entering the row.
+        row: Grid row.
+        full: Mask of all grid columns.
+    Returns:
+        Tuple of (beams leaving the row, splitters hit)."""
+    split, through = _row_masks(row)
+    hits = beams & split
+    return (beams & through) | ((hits << 1) & full) | (hits >> 1), hits.bit_count()
+
+
+def sweep_visited(lines: Iterable[str]) -> int:
+    """Part 1 of sweep alone: carry only the beam bitset down the rows.
+    Args:
+        lines: Grid rows; the first row holds S.
+    Returns:
+        Number of ^ cells visited."""
+    rows = (line.rstrip() for line in lines)
+    first = next(rows, "")
+    if not first:
+        return 0
+    full = (1 << len(first)) - 1
+    beams, visited = 1 << first.index("S"), 0
+    for row in rows:
+        beams, hits = _advance_beams(beams, row, full)
+        visited += hits
+    return visited
+
+
+def sweep_paths(lines: Iterable[str]) -> int:
+    """Part 2 of sweep alone: carry only the path counts down the rows.
+    Args:
+        lines: Grid rows; the first row holds S.
+    Returns:
+        Number of distinct paths to bottom."""
+    rows = (line.rstrip() for line in lines)
+    first = next(rows, "")
+    if not first:
+        return 0
+    paths = {first.index("S"): 1}
+    above = first
+    for row in rows:
+        paths = _advance_paths(paths, above, len(first))
+        above = row
+    return sum(paths.values())
+
+
+def sweep(lines: Iterable[str]) -> tuple[int, int]:
+    """Answer both parts in one top-down pass over the rows, without recursion.
+    Part 1 carries a bitset of beam columns from row 1 and counts the splitters it
+    covers on each row; part 2 carries path counts per active column from row 0 and
+    sums them once the last row is reached. Only the current row is held.
+    Args:
+        lines: Grid rows (e.g. a file handle); the first row holds S.
+    Returns:
+        Tuple of (visited splitters, path count)."""
+    rows = (line.rstrip() for line in lines)
+    first = next(rows, "")
+    if not first:
+        return 0, 0
+    cols = len(first)
+    full = (1 << cols) - 1
+    start_col = first.index("S")
+    beams, visited = 1 << start_col, 0
+    paths = {start_col: 1}
+    above = first
+    for row in rows:
+        paths = _advance_paths(paths, above, cols)
+        above = row
+        beams, hits = _advance_beams(beams, row, full)
+        visited += hits
+    return visited, sum(paths.values())
+
+
+def count_visited(parsed) -> int:
+    """Count ^ cells visited during traversal.
+    Args:
+        parsed: Tuple of (grid, start_col, rows, cols).
+    Returns:
+        Number of ^ cells visited."""
+    return sweep_visited(parsed[0])
+
+
+def count_paths(parsed) -> int:
+    """Count total timelines (paths) through the manifold.
+    Args:
+        parsed: Tuple of (grid, start_col, rows, cols).
+    Returns:
+        Number of distinct paths to bottom."""
+    return sweep_paths(parsed[0])
+
+
+def _cell_rows(grid: tuple[str, ...], cols: int):
+    """Yield each grid row as a uint8 array of width cols.
+    Args: grid: Grid rows.
+          cols: Grid width; short rows are padded with blocking spaces.
+    Yields: 1D uint8 arrays."""
+    import numpy as np
+
+    for row in grid:
+        yield np.frombuffer(row.encode()[:cols].ljust(cols), dtype=np.uint8)
+
+
+def sweep_vectorized(parsed) -> tuple[int, int]:
+    """Answer both parts with NumPy row operations.
+    Beams and path counts move down a row through masked shifts and adds. Path
+    counts are int64 until they could overflow on the next row, then object.
+    Args:
+        parsed: Tuple of (grid, start_col, rows, cols).
+    Returns:
+        Tuple of (visited splitters, path count)."""
+    import numpy as np
+
+    grid, start_col, rows, cols = parsed
+    beams = np.zeros(cols, dtype=bool)
+    beams[start_col] = True
+    paths = np.zeros(cols, dtype=np.int64)
+    paths[start_col] = 1
+    visited = 0
+    for index, cells in enumerate(_cell_rows(grid, cols)):
+        split = cells == ord("^")
+        through = (cells == ord(".")) | (cells == ord("S"))
+        if index:
+            hits = beams & split
+            visited += int(np.count_nonzero(hits))
+            beams &= through
+            beams[:-1] |= hits[1:]
+            beams[1:] |= hits[:-1]
+        if index < rows - 1:
+            # A column receives at most three inflows; widen before that can overflow
+            if paths.dtype != object and paths.max() > np.iinfo(np.int64).max // 3:
+                paths = paths.astype(object)
+            hits = np.where(split, paths, 0)
+            paths = np.where(through, paths, 0)
+            paths[:-1] += hits[1:]
+            paths[1:] += hits[:-1]
+    # Columns can each fit int64 while their total does not
+    return visited, sum(paths.tolist())
+
+
+class Manifold:
+    """Precomputed path and splitter counts for every start cell of a manifold.
+    Building walks the grid bottom-up once for the path-count table and sweeps a
+    beam bitset from each column for the visited-splitter counts, so queries are
+    table lookups.
+    Args:
+        grid: Grid rows."""
+
+    MAGIC = b"MFLD"
+    HEADER = struct.Struct("<4sQQ")
+
+    def __init__(self, grid: tuple[str, ...]) -> None:
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.paths = self._path_table(grid)
+        self.visited = self._visited_counts(grid)
+
+    def _path_table(self, grid: tuple[str, ...]) -> list[list[int]]:
+        """Count paths to the bottom row from every cell, bottom-up.
+        Args: grid: Grid rows.
+        Returns: Table of path counts by row and column."""
+        cols = self.cols
+        table = [[1] * cols] if grid else []
+        for row in reversed(grid[:-1]):
+            below = table[-1]
+            counts = [0] * cols
+            for col, char in enumerate(row[:cols]):
+                if char == "^":
+                    counts[col] = (below[col - 1] if col else 0) + (
+                        below[col + 1] if col + 1 < cols else 0
+                    )
+                elif char in ".S":
+                    counts[col] = below[col]
+            table.append(counts)
+        table.reverse()
+        return table
+
+    def _visited_counts(self, grid: tuple[str, ...]) -> list[int]:
+        """Count splitters a beam entering row 1 at each column visits.
+        Args: grid: Grid rows.
+        Returns: Visited splitter count by start column."""
+        full = (1 << self.cols) - 1
+        masks = [_row_masks(row) for row in grid[1:]]
+        counts = []
+        for col in range(self.cols):
+            beams, visited = 1 << col, 0
+            for split, through in masks:
+                if not beams:
+                    break
+                hits = beams & split
+                visited += hits.bit_count()
+                beams = (beams & through) | ((hits << 1) & full) | (hits >> 1)
+            counts.append(visited)
+        return counts
+
+    def paths_from(self, row: int, col: int) -> int:
+        """Count paths from a cell to the bottom row.
+        Args:
+            row: Start row.
+            col: Start column.
+        Returns:
+            Number of paths (0 outside the grid)."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.paths[row][col]
+        return 0
+
+    def visited_from(self, col: int) -> int:
+        """Count splitters visited by a beam entering row 1 at a column.
+        Args:
+            col: Start column.
+        Returns:
+            Number of ^ cells visited (0 outside the grid)."""
+        return self.visited[col] if 0 <= col < self.cols else 0
+
+    def save(self, path: str) -> None:
+        """Write a header, the visited counts as int64, then every path count as
+        little-endian bytes with an int64 length prefix, since paths outgrow int64.
+        Args:
+            path: Output file path."""
+        data = [n.to_bytes((n.bit_length() + 7) // 8, "little") for row in self.paths for n in row]
+        sizes = array("q", map(len, data))
+        visited = array("q", self.visited)
+        if sys.byteorder == "big":
+            sizes.byteswap()
+            visited.byteswap()
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.rows, self.cols))
+            visited.tofile(f)
+            sizes.tofile(f)
+            f.write(b"".join(data))
+
+    @classmethod
+    def load(cls, path: str) -> "Manifold":
+        """Read tables written by save without rebuilding them.
+        Args:
+            path: File written by save.
+        Returns:
+            The manifold."""
+        with open(path, "rb") as f:
+            magic, rows, cols = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path} is not a manifold file")
+            visited, sizes = array("q"), array("q")
+            visited.fromfile(f, cols)
+            sizes.fromfile(f, rows * cols)
+            if sys.byteorder == "big":
+                sizes.byteswap()
+                visited.byteswap()
+            blob = f.read()
+        if sum(sizes) != len(blob):
+            raise ValueError(f"{path} has truncated path counts")
+        counts, offset = [], 0
+        for size in sizes:
+            counts.append(int.from_bytes(blob[offset : offset + size], "little"))
+            offset += size
+        manifold = cls.__new__(cls)
+        manifold.rows, manifold.cols = rows, cols
+        manifold.paths = [counts[r * cols : (r + 1) * cols] for r in range(rows)]
+        manifold.visited = visited.tolist()
+        return manifold
+
+
+PARSE = parse
+PARTS = (count_visited, count_paths)
+
 if __name__ == "__main__":
-    run(__file__, parse, count_visited, count_paths)
+    run(__file__, PARSE, *PARTS)
@@ -1,6 +1,18 @@
 import unittest
 import io
-from .solve import parse, count_visited, count_paths
+import os
+import random
+import tempfile
+from .solve import (
+    Manifold,
+    parse,
+    count_visited,
+    count_visited_recursive,
+    count_paths,
+    count_paths_recursive,
+    sweep,
+    sweep_vectorized,
+)
 
 EXAMPLE = """\
 ..S..
@@ -22,5 +34,108 @@ class TestPart2(unittest.TestCase):
         self.assertEqual(count_paths(parse(io.StringIO(EXAMPLE))), 4)
 
 
+def _random_manifold(rng: random.Random, rows: int, cols: int) -> str:
+    start = rng.randrange(cols)
+    lines = ["." * start + "S" + "." * (cols - start - 1)]
+    for _ in range(rows - 1):
+        lines.append("".join(rng.choice("..^^#") for _ in range(cols)))
+    return "".join(line + "\n" for line in lines)
+
+
+class TestSweep(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(sweep(io.StringIO(EXAMPLE)), (3, 4))
+
+    def test_matches_recursion(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            text = _random_manifold(rng, rng.randint(1, 12), rng.randint(1, 12))
+            parsed = parse(io.StringIO(text))
+            with self.subTest(text=text):
+                self.assertEqual(count_visited(parsed), count_visited_recursive(parsed))
+                self.assertEqual(count_paths(parsed), count_paths_recursive(parsed))
+                self.assertEqual(
+                    sweep(io.StringIO(text)), (count_visited(parsed), count_paths(parsed))
+                )
+
+    def test_tall_manifold(self):
+        text = "S\n" + ".\n" * 5000
+        self.assertEqual(sweep(io.StringIO(text)), (0, 1))
+
+
+class TestVectorized(unittest.TestCase):
+    def test_example(self):
+        self.assertEqual(sweep_vectorized(parse(io.StringIO(EXAMPLE))), (3, 4))
+
+    def test_matches_sweep(self):
+        rng = random.Random(8)
+        for _ in range(100):
+            text = _random_manifold(rng, rng.randint(1, 12), rng.randint(1, 12))
+            with self.subTest(text=text):
+                self.assertEqual(
+                    sweep_vectorized(parse(io.StringIO(text))), sweep(io.StringIO(text))
+                )
+
+    def test_counts_beyond_int64(self):
+        text = "." * 32 + "S" + "." * 31 + "\n" + ("^" * 64 + "\n") * 150
+        expected = sweep(io.StringIO(text))
+        self.assertGreater(expected[1], 2**63)
+        self.assertEqual(sweep_vectorized(parse(io.StringIO(text))), expected)
+
+    def test_total_beyond_int64(self):
+        # A 64-level splitter pyramid: every column fits in int64, the total is 2**64
+        width = 2 * 64 + 1
+        rows = ["." * 64 + "S" + "." * 64, "." * width]
+        for level in range(64):
+            splitters = range(64 - level, 64 + level + 1, 2)
+            rows += ["".join("^" if c in splitters else "." for c in range(width)), "." * width]
+        text = "\n".join(rows) + "\n"
+        self.assertEqual(sweep(io.StringIO(text)), (64 * 65 // 2, 2**64))
+        self.assertEqual(sweep_vectorized(parse(io.StringIO(text))), (64 * 65 // 2, 2**64))
+
+
+class TestManifold(unittest.TestCase):
+    def test_example(self):
+        grid, start_col, _, _ = parse(io.StringIO(EXAMPLE))
+        manifold = Manifold(grid)
+        self.assertEqual(manifold.paths_from(0, start_col), 4)
+        self.assertEqual(manifold.visited_from(start_col), 3)
+        self.assertEqual(manifold.paths_from(2, 1), 2)
+        self.assertEqual(manifold.paths_from(4, 0), 0)
+
+    def test_matches_sweep_from_every_column(self):
+        rng = random.Random(9)
+        for _ in range(30):
+            text = _random_manifold(rng, rng.randint(1, 10), rng.randint(1, 10))
+            manifold = Manifold(parse(io.StringIO(text))[0])
+            first, rest = text.split("\n", 1)
+            for col in range(len(first)):
+                moved = "." * col + "S" + "." * (len(first) - col - 1) + "\n" + rest
+                with self.subTest(text=moved):
+                    visited, paths = sweep(io.StringIO(moved))
+                    self.assertEqual(manifold.visited_from(col), visited)
+                    self.assertEqual(manifold.paths_from(0, col), paths)
+
+    def test_save_load(self):
+        text = "." * 32 + "S" + "." * 31 + "\n" + ("^" * 64 + "\n") * 150
+        for grid in (parse(io.StringIO(EXAMPLE))[0], parse(io.StringIO(text))[0]):
+            manifold = Manifold(grid)
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "manifold.bin")
+                manifold.save(path)
+                loaded = Manifold.load(path)
+            self.assertEqual((loaded.rows, loaded.cols), (manifold.rows, manifold.cols))
+            self.assertEqual(loaded.paths, manifold.paths)
+            self.assertEqual(loaded.visited, manifold.visited)
+
+    def test_load_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "manifold.bin")
+            with open(path, "wb") as f:
+                f.write(b"\x80\x05" + bytes(30))
+            with self.assertRaises(ValueError):
+                Manifold.load(path)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,15 +1,17 @@
 """Day 8: Playground - Connect closest junction boxes in 3D space.
 
-Uses networkx for graph operations.
+Part 1 uses networkx for graph operations (imported only inside it); part 2 merges
+circuits with a union-find.
 """
 
+import heapq
 import sys
 import os
-from itertools import combinations
+from collections.abc import Iterator
+from itertools import combinations, islice
 
-import networkx as nx
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run
 
 
@@ -45,6 +47,92 @@ def build_sorted_edges(parsed):
     return edges
 
 
+def _shell(k: int) -> Iterator[tuple[int, int, int]]:
+    """Enumerate cell offsets at Chebyshev distance exactly k.
+    Args:
+        k: Shell radius in cells.
+    Yields:
+        (dx, dy, dz) offsets."""
+    if k == 0:
+        yield 0, 0, 0
+        return
+    for dx in range(-k, k + 1):
+        for dy in range(-k, k + 1):
+            if abs(dx) == k or abs(dy) == k:
+                for dz in range(-k, k + 1):
+                    yield dx, dy, dz
+            else:
+                yield dx, dy, -k
+                yield dx, dy, k
+
+
+def iter_sorted_edges(parsed, cell_size: int | None = None) -> Iterator[tuple[int, int, int]]:
+    """Yield edges lazily in the same (distance, i, j) order as build_sorted_edges.
+    Points are bucketed in a uniform grid. Each point i keeps a cursor that scans
+    shells of cells around it for partners j > i. Any point not yet scanned lies
+    outside the scanned box of cells, so it is at least as far as the box's nearest
+    face; a candidate strictly closer than that is final. A global heap holds each
+    cursor's next final edge, or a placeholder keyed by that bound when the cursor
+    must scan another shell first, so cursors only grow as far as the edges read.
+    Args:
+        parsed: List of 3D points.
+        cell_size: Grid cell edge (default: half the mean point spacing, which keeps
+            the shells scanned for the shortest edges small).
+    Yields:
+        (distance_sq, i, j) tuples with i < j, in increasing order."""
+    n = len(parsed)
+    if n < 2:
+        return
+    low = [min(p[axis] for p in parsed) for axis in range(3)]
+    extent = [max(p[axis] for p in parsed) - low[axis] + 1 for axis in range(3)]
+    if cell_size is None:
+        cell_size = max(1, round((extent[0] * extent[1] * extent[2] / n) ** (1 / 3) / 2))
+    cells = [tuple((p[axis] - low[axis]) // cell_size for axis in range(3)) for p in parsed]
+    buckets: dict[tuple[int, int, int], list[int]] = {}
+    for i, cell in enumerate(cells):
+        buckets.setdefault(cell, []).append(i)
+    max_shell = max(extent) // cell_size
+
+    shells = [-1] * n
+    candidates: list[list[tuple[int, int]]] = [[] for _ in range(n)]
+
+    def next_entry(i: int) -> tuple[int, int, int] | None:
+        """Heap entry for cursor i: its next final edge, a placeholder, or None."""
+        k = shells[i]
+        local = candidates[i]
+        if k >= max_shell:
+            return (local[0][0], i, local[0][1]) if local else None
+        point, cell = parsed[i], cells[i]
+        reach = min(
+            min(
+                point[axis] - low[axis] - (cell[axis] - k) * cell_size,
+                low[axis] + (cell[axis] + k + 1) * cell_size - point[axis],
+            )
+            for axis in range(3)
+        )
+        if local and local[0][0] < reach * reach:
+            return local[0][0], i, local[0][1]
+        return reach * reach, i, -1
+
+    heap = [(0, i, -1) for i in range(n)]
+    while heap:
+        d, i, j = heapq.heappop(heap)
+        if j < 0:
+            shells[i] = k = shells[i] + 1
+            cx, cy, cz = cells[i]
+            point, local = parsed[i], candidates[i]
+            for dx, dy, dz in _shell(k):
+                for other in buckets.get((cx + dx, cy + dy, cz + dz), ()):
+                    if other > i:
+                        heapq.heappush(local, (distance_sq(point, parsed[other]), other))
+        else:
+            yield d, i, j
+            heapq.heappop(candidates[i])
+        entry = next_entry(i)
+        if entry is not None:
+            heapq.heappush(heap, entry)
+
+
 def count_part1(parsed, num_connections=1000) -> int:
     """Connect closest pairs, multiply 3 largest circuit sizes.
     Args:
@@ -52,12 +140,12 @@ def count_part1(parsed, num_connections=1000) -> int:
         num_connections: Number of connections to make.
     Returns:
         Product of 3 largest circuit sizes."""
-    edges = build_sorted_edges(parsed)
+    import networkx as nx
 
     G = nx.Graph()
     G.add_nodes_from(range(len(parsed)))
 
-    for _, i, j in edges[:num_connections]:
+    for _, i, j in islice(iter_sorted_edges(parsed), num_connections):
         G.add_edge(i, j)
 
     sizes = sorted([len(c) for c in nx.connected_components(G)], reverse=True)
@@ -66,10 +154,38 @@ def count_part1(parsed, num_connections=1000) -> int:
 
 def count_part2(parsed) -> int:
     """Connect until all in one circuit, return product of last pair's X coords.
+    Edges are read lazily from iter_sorted_edges and stop at full connectivity;
+    a union-find with path halving tracks the number of circuits left.
     Args:
         parsed: List of 3D points.
     Returns:
         Product of X coordinates of last connected pair."""
+    parent = list(range(len(parsed)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = i = parent[parent[i]]
+        return i
+
+    circuits = len(parsed)
+    for _, i, j in iter_sorted_edges(parsed):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[root_i] = root_j
+            circuits -= 1
+            if circuits == 1:
+                return parsed[i][0] * parsed[j][0]
+    return 0
+
+
+def count_part2_graph(parsed) -> int:
+    """Part 2 over all sorted edges with networkx connectivity checks (reference).
+    Args:
+        parsed: List of 3D points.
+    Returns:
+        Product of X coordinates of last connected pair."""
+    import networkx as nx
+
     edges = build_sorted_edges(parsed)
 
     G = nx.Graph()
@@ -83,5 +199,8 @@ def count_part2(parsed) -> int:
     return 0
 
 
+PARSE = parse
+PARTS = (count_part1, count_part2)
+
 if __name__ == "__main__":
-    run(__file__, parse, count_part1, count_part2)
+    run(__file__, PARSE, *PARTS)
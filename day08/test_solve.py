@@ -1,6 +1,15 @@
 import unittest
 import io
-from .solve import parse, count_part1
+import random
+from itertools import islice
+from .solve import (
+    parse,
+    build_sorted_edges,
+    count_part1,
+    count_part2,
+    count_part2_graph,
+    iter_sorted_edges,
+)
 
 EXAMPLE = """\
 162,817,812
@@ -33,5 +42,38 @@ class TestPart1(unittest.TestCase):
         self.assertEqual(count_part1(parse(io.StringIO(EXAMPLE)), 10), 40)
 
 
+class TestPart2(unittest.TestCase):
+    def test_example(self):
+        # The last connection that joins everything is 216,146,977 to 117,168,530
+        self.assertEqual(count_part2(parse(io.StringIO(EXAMPLE))), 216 * 117)
+
+    def test_matches_graph(self):
+        rng = random.Random(9)
+        for _ in range(30):
+            count = rng.randint(1, 40)
+            points = [tuple(rng.randint(0, 50) for _ in range(3)) for _ in range(count)]
+            with self.subTest(points=points):
+                self.assertEqual(count_part2(points), count_part2_graph(points))
+
+
+class TestEdgeGenerator(unittest.TestCase):
+    def test_matches_sorted_edges(self):
+        rng = random.Random(8)
+        for _ in range(30):
+            span = rng.choice((3, 50, 1000))
+            count = rng.randint(0, 40)
+            points = [tuple(rng.randint(0, span) for _ in range(3)) for _ in range(count)]
+            for cell_size in (None, span // 7 + 1, span):
+                with self.subTest(points=points, cell_size=cell_size):
+                    self.assertEqual(
+                        list(iter_sorted_edges(points, cell_size)), build_sorted_edges(points)
+                    )
+
+    def test_prefix(self):
+        points = parse(io.StringIO(EXAMPLE))
+        edges = build_sorted_edges(points)
+        self.assertEqual(list(islice(iter_sorted_edges(points), 10)), edges[:10])
+
+
 if __name__ == "__main__":
     unittest.main()
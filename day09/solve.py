@@ -3,12 +3,10 @@
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run
 
-from shapely.geometry import Point
-from shapely.geometry.polygon import Polygon
-
 
 def parse(f):
     """Parse polygon vertices from comma-separated coordinates.
@@ -38,6 +36,9 @@ def count_part2(parsed) -> int:
         parsed: List of (x, y) vertices forming the polygon.
     Returns:
         Area of largest contained rectangle."""
+    from shapely.geometry import Point
+    from shapely.geometry.polygon import Polygon
+
     polygon = Polygon(parsed)
     shape_sizes = []
     for start_point in parsed:
@@ -53,5 +54,8 @@ def count_part2(parsed) -> int:
     return max(shape_sizes)
 
 
+PARSE = parse
+PARTS = (count_part1, count_part2)
+
 if __name__ == "__main__":
-    run(__file__, parse, count_part1, count_part2)
+    run(__file__, PARSE, *PARTS)
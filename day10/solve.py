@@ -1,10 +1,10 @@
 """Day 10: [Problem Title] - [Brief description]."""
 
-from z3 import Int, Optimize, Sum, sat
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run
 
 
@@ -129,6 +129,8 @@ def _solve_min_sum(eq_list):
         eq_list: List of (total, idxs) constraints meaning sum(x[i] for i in idxs) == total.
     Returns:
         List of variable values (x0..x{n-1}) for an optimal model, or None if unsat."""
+    from z3 import Int, Optimize, Sum, sat
+
     # infer variables
     n = max(i for total, idxs in eq_list for i in idxs) + 1
     x = [Int(f"x{i}") for i in range(n)]
@@ -191,5 +193,8 @@ def count_part2(parsed) -> int:
     return presses
 
 
+PARSE = parse
+PARTS = (count_part1, count_part2)
+
 if __name__ == "__main__":
-    run(__file__, parse, count_part1, count_part2)
+    run(__file__, PARSE, *PARTS)
@@ -3,7 +3,8 @@
 import sys
 import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import run
 
 
@@ -63,5 +64,8 @@ def count_part2(graph) -> int:
     ) * paths("fft", "dac") * paths("dac", "out")
 
 
+PARSE = parse
+PARTS = (count_part1, count_part2)
+
 if __name__ == "__main__":
-    run(__file__, parse, count_part1, count_part2)
+    run(__file__, PARSE, *PARTS)
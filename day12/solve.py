@@ -1,8 +1,13 @@
 """Day 12: Christmas Tree Farm - Count regions where presents can fit."""
 
 import re
+import sys
+import os
 from functools import lru_cache
-from pathlib import Path
+
+if not __package__:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils import run
 
 
 def parse(f):
@@ -188,8 +193,8 @@ def count_part1(parsed) -> int:
     return sum(1 for w, h, qty in regions if _can_fit_region(w, h, shapes, qty))
 
 
+PARSE = parse
+PARTS = (count_part1,)
+
 if __name__ == "__main__":
-    with Path(__file__).with_name("input.txt").open() as f:
-        parsed = parse(f)
-    ans = count_part1(parsed)
-    print(f"Part 1: {ans}")
+    run(__file__, PARSE, *PARTS)
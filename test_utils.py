@@ -0,0 +1,139 @@
+import io
+import json
+import mmap
+import os
+import random
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from utils import (
+    Instrumentation,
+    MappedLines,
+    _option,
+    iter_lines,
+    iter_mapped_lines,
+    line_ranges,
+    run_parts,
+)
+
+
+class TestMappedLines(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, data: bytes):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def test_matches_file_iteration(self):
+        self.write(b"L68\nR48\r\n\nL5")
+        with open(self.path) as f:
+            expected = list(f)
+        for chunk_size in (1, 3, 1 << 20):
+            self.assertEqual(list(iter_mapped_lines(self.path, chunk_size=chunk_size)), expected)
+
+    def test_windows_cross_granularity(self):
+        rng = random.Random(1)
+        lines = [b"x" * rng.randint(0, 3 * mmap.ALLOCATIONGRANULARITY) + b"\n" for _ in range(20)]
+        self.write(b"".join(lines))
+        for chunk_size in (1, 1000, mmap.ALLOCATIONGRANULARITY, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                mapped = iter_mapped_lines(self.path, encoding=None, chunk_size=chunk_size)
+                self.assertEqual(list(mapped), lines)
+        ranges = line_ranges(self.path, chunk_bytes=mmap.ALLOCATIONGRANULARITY + 7)
+        lines_by_range = [
+            line
+            for start, stop in ranges
+            for line in iter_mapped_lines(self.path, encoding=None, start=start, stop=stop)
+        ]
+        self.assertEqual(lines_by_range, lines)
+
+    def test_bytes_mode(self):
+        self.write(b"1-5\n10-15\n")
+        self.assertEqual(list(iter_mapped_lines(self.path, encoding=None)), [b"1-5\n", b"10-15\n"])
+
+    def test_empty_file(self):
+        self.assertEqual(list(MappedLines(self.path)), [])
+
+    def test_line_ranges(self):
+        self.write(b"R1\nL22\nR333\nL4")
+        ranges = line_ranges(self.path, chunk_bytes=4)
+        self.assertEqual(ranges, [(0, 7), (7, 12), (12, 14)])
+        lines = [
+            line
+            for start, stop in ranges
+            for line in iter_mapped_lines(self.path, start=start, stop=stop)
+        ]
+        self.assertEqual(lines, ["R1\n", "L22\n", "R333\n", "L4"])
+
+    def test_reiterable(self):
+        self.write(b"a\n\nb\n")
+        lines = MappedLines(self.path, chunk_size=2)
+        self.assertEqual(list(iter_lines(lines)), ["a", "b"])
+        self.assertEqual(list(iter_lines(lines)), ["a", "b"])
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_option(self):
+        self.assertEqual(_option("metrics", ["--metrics"]), "-")
+        self.assertEqual(_option("profile", ["--profile=out"]), "out")
+
+    def test_disabled_by_default(self):
+        instrumentation = Instrumentation()
+        self.assertEqual(instrumentation.measure("part1", sum, [1, 2]), 3)
+        self.assertEqual(instrumentation.phases, {})
+
+    def test_records_phases(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            metrics = os.path.join(tmp, "metrics.jsonl")
+            instrumentation = Instrumentation(
+                metrics, profile_dir=tmp, trace_memory=True, label="day01"
+            )
+            data = instrumentation.measure("parse", lambda: list(range(1000)))
+            instrumentation.measure("part1", sum, data)
+            instrumentation.skip("part2")
+            instrumentation.emit(input="x")
+            with open(metrics) as f:
+                record = json.loads(f.read())
+            self.assertTrue(
+                os.path.exists(os.path.join(tmp, f"{instrumentation.run_id}-part1.prof"))
+            )
+        self.assertTrue(instrumentation.run_id.startswith("day01-"))
+        self.assertIn(str(os.getpid()), instrumentation.run_id)
+        self.assertEqual(record["input"], "x")
+        self.assertGreater(record["phases"]["parse"]["peak_bytes"], 0)
+        self.assertEqual(record["phases"]["part2"], {"cached": True})
+
+    def test_time_only_by_default(self):
+        calls = []
+        instrumentation = Instrumentation("-")
+        self.assertEqual(instrumentation.measure("part1", lambda: calls.append(1) or 7), 7)
+        self.assertEqual(list(instrumentation.phases["part1"]), ["seconds"])
+        self.assertEqual(len(calls), 1)
+
+
+class TestPrintResults(unittest.TestCase):
+    def test_parse_not_applicable_for_line_days(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.txt")
+            metrics = os.path.join(tmp, "metrics.jsonl")
+            with open(path, "w") as f:
+                f.write("1\n2\n")
+            argv = ["solve.py", "--no-cache", f"--metrics={metrics}"]
+            with mock.patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()):
+                run_parts(lambda lines: sum(map(int, lines)), input_file=path)
+            with open(metrics) as f:
+                phases = json.loads(f.read())["phases"]
+        self.assertEqual(phases["parse"], {"applicable": False})
+        self.assertIn("seconds", phases["part1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
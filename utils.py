@@ -1,10 +1,108 @@
 """Shared utilities for Advent of Code solutions."""
 
+import io
+import mmap
 import os
-from collections.abc import Callable, Iterator
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
 
+CHUNK_SIZE = 1 << 20
 
-def iter_lines(lines: list[str]) -> Iterator[str]:
+
+def iter_mapped_lines(
+    path: str,
+    encoding: str | None = "utf-8",
+    chunk_size: int = CHUNK_SIZE,
+    start: int = 0,
+    stop: int | None = None,
+) -> Iterator[str | bytes]:
+    """Stream lines from a memory-mapped file, decoding one chunk at a time.
+    Each chunk is mapped as its own window and unmapped before its lines are
+    yielded, so resident memory stays bounded by the chunk size, not the file.
+    Args:
+        path: Input file path.
+        encoding: Text encoding, or None to yield raw bytes lines.
+        chunk_size: Approximate number of bytes decoded per chunk.
+        start: Byte offset of the first line (see line_ranges).
+        stop: Byte offset just past the last line (default: end of file).
+    Yields:
+        Each line including its trailing newline, like iterating a file handle."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        size = size if stop is None else min(stop, size)
+        pos = start
+        while pos < size:
+            chunk = _map_chunk(f.fileno(), pos, min(pos + chunk_size, size), size)
+            pos += len(chunk)
+            if encoding is None:
+                yield from io.BytesIO(chunk)
+            else:
+                yield from io.StringIO(chunk.decode(encoding), newline=None)
+
+
+def _map_chunk(fd: int, pos: int, want: int, size: int) -> bytes:
+    """Copy the bytes from pos through the first line end at or after want out of a
+    window mapped at an ALLOCATIONGRANULARITY-aligned offset.
+    Args:
+        fd: Open file descriptor.
+        pos: Offset of the chunk's first byte.
+        want: Offset the chunk should reach before ending at a line break.
+        size: Offset past the last readable byte.
+    Returns:
+        The chunk, ending in a newline unless it reaches size."""
+    base = pos - pos % mmap.ALLOCATIONGRANULARITY
+    limit = want
+    while True:
+        with mmap.mmap(fd, limit - base, access=mmap.ACCESS_READ, offset=base) as mm:
+            end = mm.find(b"\n", want - 1 - base)
+            if end != -1 or limit == size:
+                end = limit - base if end == -1 else end + 1
+                return mm[pos - base : end]
+        # The line crosses the window; widen it and search again
+        limit = min(limit + max(want - pos, mmap.ALLOCATIONGRANULARITY), size)
+
+
+def line_ranges(path: str, chunk_bytes: int = CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split a file into byte ranges that start and end on line boundaries.
+    Args:
+        path: Input file path.
+        chunk_bytes: Approximate size of each range.
+    Returns:
+        List of (start, stop) byte offsets covering the whole file."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    ranges = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            stop = mm.find(b"\n", min(start + chunk_bytes, size) - 1)
+            stop = size if stop == -1 else stop + 1
+            ranges.append((start, stop))
+            start = stop
+    return ranges
+
+
+class MappedLines:
+    """Re-iterable, memory-mapped view over the lines of a file.
+    Args:
+        path: Input file path.
+        encoding: Text encoding, or None to yield raw bytes lines.
+        chunk_size: Approximate number of bytes decoded per chunk."""
+
+    def __init__(
+        self, path: str, encoding: str | None = "utf-8", chunk_size: int = CHUNK_SIZE
+    ) -> None:
+        self.path = path
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[str | bytes]:
+        return iter_mapped_lines(self.path, self.encoding, self.chunk_size)
+
+
+def iter_lines(lines: Iterable[str]) -> Iterator[str]:
     """Iterate over non-empty stripped lines.
     Args:
         lines: Raw input lines.
@@ -16,7 +114,7 @@ def iter_lines(lines: list[str]) -> Iterator[str]:
             yield line
 
 
-def parse_lines(lines: list[str], parse_line_func: Callable[[str], Iterator]) -> Iterator:
+def parse_lines(lines: Iterable[str], parse_line_func: Callable[[str], Iterator]) -> Iterator:
     """Parse lines with a function that yields items.
     Args:
         lines: Raw input lines.
@@ -27,7 +125,7 @@ def parse_lines(lines: list[str], parse_line_func: Callable[[str], Iterator]) ->
         yield from parse_line_func(line)
 
 
-def map_lines(lines: list[str], parse_func: Callable) -> list:
+def map_lines(lines: Iterable[str], parse_func: Callable) -> list:
     """Map a function over each line.
     Args:
         lines: Raw input lines.
@@ -37,32 +135,257 @@ def map_lines(lines: list[str], parse_func: Callable) -> list:
     return [parse_func(line) for line in iter_lines(lines)]
 
 
-def _print_results(data, part1_func, part2_func):
-    """Print results for both parts.
+def merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sort ranges and merge overlapping or adjacent ones.
+    Args:
+        ranges: (start, end) ranges, possibly overlapping or repeated.
+    Returns:
+        Sorted, disjoint ranges covering the same IDs."""
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def load_input(module, path: str):
+    """Load an input file the way a day's entry point does.
+    Args:
+        module: Day solver module; its PARSE function is applied if it defines one.
+        path: Input file path.
+    Returns:
+        Parsed data, or re-iterable lines for days whose parts take lines."""
+    lines = MappedLines(path)
+    parse_func = getattr(module, "PARSE", None)
+    return lines if parse_func is None else parse_func(lines)
+
+
+def _option(name: str, argv: list[str] | None = None) -> str | None:
+    """Read a --name[=VALUE] flag, falling back to the AOC_NAME environment variable.
+    Args:
+        name: Flag name without dashes.
+        argv: Command-line arguments (default: sys.argv).
+    Returns:
+        The flag value ("-" for a bare flag), or None if unset."""
+    argv = sys.argv[1:] if argv is None else argv
+    for arg in argv:
+        if arg == f"--{name}":
+            return "-"
+        if arg.startswith(f"--{name}="):
+            return arg.split("=", 1)[1]
+    return os.environ.get(f"AOC_{name.upper().replace('-', '_')}") or None
+
+
+class Instrumentation:
+    """Per-phase wall time, with opt-in peak traced memory and profile dumps, for one run.
+    Each phase is timed on its own untraced run; memory tracing and profiling each
+    repeat the phase afterwards, so their overhead never reaches the recorded time.
+    Args:
+        metrics: Where to append one JSON record per run ("-" for stderr), or None to disable.
+        profile_dir: Directory receiving one profile per phase, or None.
+        profiler: "cprofile" (.prof files) or "pyinstrument" (.html files).
+        trace_memory: Whether to record each phase's peak traced memory.
+        label: Prefix for profile file names (e.g. the day)."""
+
+    def __init__(
+        self,
+        metrics: str | None = None,
+        profile_dir: str | None = None,
+        profiler: str = "cprofile",
+        trace_memory: bool = False,
+        label: str = "run",
+    ) -> None:
+        self.metrics = metrics
+        self.profile_dir = profile_dir
+        self.profiler = profiler
+        self.trace_memory = trace_memory
+        # Profile dumps are named per run so later runs and other days don't overwrite them
+        self.run_id = f"{label}-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.phases: dict[str, dict] = {}
+
+    @classmethod
+    def from_options(cls, argv: list[str] | None = None, label: str = "run") -> "Instrumentation":
+        """Configure from --metrics[=PATH], --profile=DIR, --profiler=NAME and --trace-memory
+        (or AOC_* variables).
+        Args:
+            argv: Command-line arguments (default: sys.argv).
+            label: Prefix for profile file names.
+        Returns:
+            Instrumentation, possibly disabled."""
+        profile_dir = _option("profile", argv)
+        return cls(
+            _option("metrics", argv),
+            None if profile_dir == "-" else profile_dir,
+            _option("profiler", argv) or "cprofile",
+            _option("trace-memory", argv) is not None,
+            label,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anything is being recorded."""
+        return bool(self.metrics or self.profile_dir)
+
+    def measure(self, phase: str, func: Callable, *args):
+        """Run one phase, recording its time (and traced memory or a profile if asked).
+        Args:
+            phase: Phase name (e.g. "parse", "part1").
+            func: Function to run.
+            args: Arguments for func.
+        Returns:
+            The result of the timed run of func."""
+        if not self.enabled:
+            return func(*args)
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        finally:
+            self.phases[phase] = {"seconds": time.perf_counter() - start}
+        if self.trace_memory:
+            import tracemalloc
+
+            tracemalloc.start()
+            try:
+                func(*args)
+                self.phases[phase]["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        if self.profile_dir:
+            profiler = self._start_profiler()
+            try:
+                func(*args)
+            finally:
+                self._dump_profile(profiler, phase)
+        return result
+
+    def skip(self, phase: str) -> None:
+        """Record a phase answered without running (e.g. from the cache).
+        Args:
+            phase: Phase name."""
+        self.phases[phase] = {"cached": True}
+
+    def not_applicable(self, phase: str) -> None:
+        """Record a phase the solver does not have (e.g. parse for days whose parts take lines).
+        Args:
+            phase: Phase name."""
+        self.phases[phase] = {"applicable": False}
+
+    def _start_profiler(self):
+        """Start the configured profiler.
+        Returns:
+            Running profiler."""
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+        else:
+            from cProfile import Profile as Profiler
+        profiler = Profiler()
+        if self.profiler == "pyinstrument":
+            profiler.start()
+        else:
+            profiler.enable()
+        return profiler
+
+    def _dump_profile(self, profiler, phase: str) -> None:
+        """Stop a profiler and write its output for one phase.
+        Args:
+            profiler: Profiler returned by _start_profiler.
+            phase: Phase name, appended to the run id in the file name."""
+        os.makedirs(self.profile_dir, exist_ok=True)
+        stem = os.path.join(self.profile_dir, f"{self.run_id}-{phase}")
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+            with open(f"{stem}.html", "w") as f:
+                f.write(profiler.output_html())
+        else:
+            profiler.disable()
+            profiler.dump_stats(f"{stem}.prof")
+
+    def emit(self, **fields) -> None:
+        """Write the run's record as one JSON line.
+        Args:
+            fields: Extra fields identifying the run (solver, input, ...)."""
+        if not self.metrics:
+            return
+        import json
+
+        line = json.dumps(fields | {"phases": self.phases}) + "\n"
+        if self.metrics == "-":
+            sys.stderr.write(line)
+        else:
+            with open(self.metrics, "a") as f:
+                f.write(line)
+
+
+def _print_results(load_data, input_file, *part_funcs, parse_phase: bool = True):
+    """Print results for each part, reusing cached answers unless --no-cache is given.
+    Phases are instrumented when --metrics or --profile is given (see Instrumentation).
     Args:
-        data: Parsed input data.
-        part1_func: Function for part 1.
-        part2_func: Function for part 2."""
-    print(f"Part 1: {part1_func(data)}")
-    print(f"Part 2: {part2_func(data)}")
+        load_data: Function returning the parsed input; only called on a cache miss.
+        input_file: Input file path, hashed into the cache key.
+        part_funcs: Functions for part 1, part 2, ...
+        parse_phase: False when load_data only opens the lines and the parts do their
+            own parsing; parse is then recorded as not applicable instead of timed."""
+    from aoc.cache import MISSING, ResultCache, cache_disabled, cache_key, file_digest
+
+    cache = None if cache_disabled() else ResultCache()
+    solver = os.path.abspath(sys.modules[part_funcs[0].__module__].__file__)
+    instrumentation = Instrumentation.from_options(
+        label=os.path.basename(os.path.dirname(solver))
+    )
+    input_digest = cache and file_digest(input_file)
+    data = MISSING
+    for number, part_func in enumerate(part_funcs, 1):
+        key = cache and cache_key(input_digest, part_func, number)
+        answer = cache.get(key) if cache else MISSING
+        if answer is MISSING:
+            if data is MISSING and parse_phase:
+                data = instrumentation.measure("parse", load_data)
+            elif data is MISSING:
+                data = load_data()
+                instrumentation.not_applicable("parse")
+            answer = instrumentation.measure(f"part{number}", part_func, data)
+            if cache:
+                cache.put(key, answer)
+        else:
+            instrumentation.skip(f"part{number}")
+        print(f"Part {number}: {answer}")
+    if cache:
+        cache.close()
+    instrumentation.emit(
+        solver=solver,
+        input=os.path.abspath(input_file),
+        time=time.time(),
+    )
 
 
-def run_parts(part1_func, part2_func, input_file="input.txt"):
-    """Run both parts with the given functions (functions take lines).
+def run_parts(*part_funcs, input_file="input.txt"):
+    """Run each part with the given functions (functions take re-iterable lines).
     Args:
-        part1_func: Function that takes lines and returns part 1 result.
-        part2_func: Function that takes lines and returns part 2 result.
+        part_funcs: Functions that take lines and return the part 1, part 2, ... results.
         input_file: Input file path (default: "input.txt")."""
-    with open(input_file) as f:
-        _print_results(f.readlines(), part1_func, part2_func)
+    _print_results(lambda: MappedLines(input_file), input_file, *part_funcs, parse_phase=False)
 
 
-def run(caller_file, parse_func, part1_func, part2_func):
-    """Run both parts with parsed input.
+def run(caller_file, parse_func, *part_funcs):
+    """Run each part with parsed input.
     Args:
         caller_file: __file__ from the calling module.
-        parse_func: Function that takes file handle and returns parsed data.
-        part1_func: Function that takes parsed data and returns part 1 result.
-        part2_func: Function that takes parsed data and returns part 2 result."""
-    with open(os.path.join(os.path.dirname(caller_file), "input.txt")) as f:
-        _print_results(parse_func(f), part1_func, part2_func)
+        parse_func: Function that takes an iterable of lines (e.g. a file handle) and returns parsed data.
+        part_funcs: Functions that take parsed data and return the part 1, part 2, ... results."""
+    input_file = os.path.join(os.path.dirname(caller_file), "input.txt")
+    _print_results(lambda: parse_func(MappedLines(input_file)), input_file, *part_funcs)
+
+
+def run_module(module, input_file: str):
+    """Run each part of a day module (see its PARSE/PARTS) on an input file.
+    Args:
+        module: Day solver module.
+        input_file: Input file path."""
+    _print_results(
+        lambda: load_input(module, input_file),
+        input_file,
+        *module.PARTS,
+        parse_phase=hasattr(module, "PARSE"),
+    )